@@ -10,7 +10,6 @@ Requirements:
     - Python 3.6+
     - Required packages:
         - sqlite3 (built-in) or another DB driver depending on your database
-        - pandas (for easy data handling and CSV export)
         - For MS SQL Server: pyodbc
         - For Oracle: oracledb
 
@@ -52,7 +51,7 @@ from datetime import datetime
 import traceback
 
 # Import utility functions
-from utils import connect_to_database, run_query, export_to_csv, read_config
+from utils import connect_to_database, stream_query_to_csv, read_config
 
 # Ensure logs directory exists
 os.makedirs('logs', exist_ok=True)
@@ -134,23 +133,17 @@ def main():
         connection = connect_to_database(config, logger)
         
         try:
-            # Run query
-            logger.info("Executing SQL query")
-            df = run_query(connection, query, logger)
-            
             # Update the configuration to use a directory for CSV output
             csv_output_dir = config.get('csv_output_dir', '.')
 
-            # Ensure the CSV output directory exists
-            os.makedirs(csv_output_dir, exist_ok=True)
-
-            # Generate a timestamped filename
+            # Generate a timestamped filename. stream_query_to_csv creates
+            # the output directory if it doesn't exist.
             csv_filename = f"query_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             csv_output = os.path.join(csv_output_dir, csv_filename)
 
-            # Export to CSV
-            logger.info(f"Exporting results to {csv_output}")
-            csv_file = export_to_csv(df, csv_output, logger)
+            # Run query and stream the rows straight to CSV
+            logger.info(f"Executing SQL query and streaming results to {csv_output}")
+            csv_file = stream_query_to_csv(connection, query, csv_output, logger)
             
             logger.info(f"Process completed successfully. CSV file saved to: {csv_file}")
             
@@ -5,7 +5,7 @@ This script replaces bracketed fields in a Word (.docx) document with values fro
 For example, it will replace [First Name] or [First_Name] with "John" based on Excel data.
 
 Requirements:
-    - Python 3.6 or higher
+    - Python 3.7 or higher
     - Required Python packages:
         pip install python-docx==0.8.11    # For Word document handling
         pip install openpyxl==3.0.10       # For Excel file handling
@@ -22,6 +22,8 @@ Usage:
             output_directory = path/to/output
             filename_field1 = First Name  # Optional - uses timestamp if both fields omitted
             filename_field2 = Last Name   # Optional - uses timestamp if both fields omitted
+            max_workers = 4               # Optional - parallel worker processes (default: CPU count)
+            compress_level = 1            # Optional - zip deflate level 0-9 for output files (default: 1)
 
     2. Run the script:
        python docx_template_filler.py <config_file>
@@ -34,169 +36,491 @@ Note:
     - Fields are case-sensitive: [First_Name] ≠ [first_name]
     - Output files will be named using the specified filename fields (or timestamp if omitted)
     - All dates are formatted as "January 1, 2025" for better readability
+    - Rows are filled in parallel worker processes; set max_workers = 1 to use a single worker
+    - Set the DOCX_TEMPLATE_DEBUG environment variable to 1 to print stack traces for row errors
 """
 
 import sys
 import os
+import io
 import re
+import copy
 import datetime as dt
 import time
-from docx import Document
+import zipfile
+import multiprocessing
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from docx.opc.oxml import serialize_part_xml
+from lxml import etree
 from openpyxl import load_workbook
 import traceback
-from utils import format_excel_cell_date, read_config, sanitize_filename, get_unique_filename
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from bisect import bisect_right
+from itertools import accumulate
+from utils import format_excel_value, number_format_includes_time, read_config, sanitize_filename, get_unique_filename, list_filenames
 
-def find_fields_in_document(doc):
+# Pattern matching a bracketed field such as [First Name]
+FIELD_PATTERN = re.compile(r'\[([^\]]+)\]')
+
+# Tabs and line breaks (\n, \r\n or \r), which Word stores as w:tab and w:br elements
+TAB_OR_BREAK_PATTERN = re.compile(r'(\t|\r\n?|\n)')
+LINE_BREAKS = ('\n', '\r\n', '\r')
+
+# Print full stack traces for row errors (set DOCX_TEMPLATE_DEBUG=1)
+DEBUG = os.environ.get('DOCX_TEMPLATE_DEBUG', '0') not in ('', '0')
+
+# Parsed template and save threads held by each worker process, set once by _init_worker
+_worker_template = None
+_worker_save_pool = None
+
+# Default deflate level for saved documents. python-docx uses zlib's default
+# (6); level 1 is several times faster and the files are only slightly larger.
+DOCX_COMPRESSION_LEVEL = 1
+
+# Most rows sent to a worker in one task. Batching cuts the per-task pickling
+# and inter-process overhead, which is significant next to a sub-second row.
+MAX_ROWS_PER_TASK = 8
+
+# Threads in each worker process that zip and write finished documents
+SAVE_THREADS_PER_WORKER = 2
+
+# WordprocessingML names used when filling the document XML
+W_P = qn('w:p')
+W_T = qn('w:t')
+W_TAB = qn('w:tab')
+W_BR = qn('w:br')
+XML_SPACE = qn('xml:space')
+
+def _iter_fields(text):
+    """
+    Yield every bracketed field such as [First Name] in the text.
+    
+    Finds the same fields as FIELD_PATTERN, with their offsets, using str.find.
+    
+    Args:
+        text (str): Text to scan
+        
+    Yields:
+        tuple: (start, end, name) where text[start:end] is the full field
+            including brackets and name is the unstripped text between them
+    """
+    i = 0
+    while True:
+        start = text.find('[', i)
+        if start < 0:
+            return
+        close = text.find(']', start + 1)
+        if close < 0:
+            return
+        if close == start + 1:
+            # Empty brackets are not a field; keep looking after the '['
+            i = start + 1
+            continue
+        yield start, close + 1, text[start + 1:close]
+        i = close + 1
+
+def _replace_fields_in_text(text, field_mapping):
+    """
+    Replace every known field in a single piece of text in one pass.
+    
+    Uses one compiled-regex substitution driven by the mapping, so the scan
+    runs in C and Python code only runs per field found. Replacement values
+    are never rescanned, so a value that itself looks like a field is left as-is.
+    
+    Args:
+        text (str): Text to process
+        field_mapping (dict): Dictionary mapping field names to string values
+        
+    Returns:
+        str: The text with fields replaced
+    """
+    def replace(match):
+        value = field_mapping.get(match.group(1).strip())
+        return match.group(0) if value is None else value
+    
+    return FIELD_PATTERN.sub(replace, text)
+
+def _set_text_node(t, text):
+    """Set a w:t element's text, keeping any leading or trailing spaces."""
+    t.text = text
+    # Word drops leading/trailing spaces unless told to preserve them
+    if text != text.strip():
+        t.set(XML_SPACE, 'preserve')
+
+def _write_text(t, text):
+    """
+    Write replacement text into a w:t element.
+    
+    Word stores tabs and line breaks as w:tab and w:br elements rather than
+    as characters, so text containing them is split into new elements placed
+    right after this one, the same way python-docx's run.text setter does.
+    A Windows line ending (\r\n) is a single break.
+    
+    Args:
+        t: w:t element
+        text (str): New text
+    """
+    if '\t' not in text and '\n' not in text and '\r' not in text:
+        _set_text_node(t, text)
+        return
+    
+    pieces = TAB_OR_BREAK_PATTERN.split(text)
+    _set_text_node(t, pieces[0])
+    for piece in pieces[1:]:
+        if piece == '\t':
+            element = t.makeelement(W_TAB, {})
+        elif piece in LINE_BREAKS:
+            element = t.makeelement(W_BR, {})
+        elif piece:
+            element = t.makeelement(W_T, {})
+            _set_text_node(element, piece)
+        else:
+            continue
+        t.addnext(element)
+        t = element
+
+def _iter_paragraph_text_nodes(element):
+    """
+    Group the w:t text nodes of a document part by paragraph.
+    
+    Covers every paragraph in the part, including those in tables, nested
+    tables and text boxes. A text box's paragraphs sit inside a run of the
+    paragraph that anchors it, so each text node goes to its nearest
+    enclosing paragraph.
+    
+    Args:
+        element: Root element of the document part
+        
+    Returns:
+        list: One list of w:t elements per paragraph, in document order
+    """
+    paragraphs = {}
+    for t in element.iter(W_T):
+        paragraphs.setdefault(next(t.iterancestors(W_P), None), []).append(t)
+    return list(paragraphs.values())
+
+def find_field_paragraphs(element):
+    """
+    Locate the paragraphs of a document part that contain a '['.
+    
+    Every row fills a fresh copy of the same template, so the paragraphs
+    worth visiting are found once here. Text nodes are identified by their
+    position in document order, which is the same in every copy.
+    
+    Args:
+        element: Root element of the document part
+        
+    Returns:
+        list: For each paragraph that may hold a field, the positions of its
+            w:t elements among all w:t elements of the part
+    """
+    positions = {t: i for i, t in enumerate(element.iter(W_T))}
+    field_paragraphs = []
+    for text_nodes in _iter_paragraph_text_nodes(element):
+        if '[' in ''.join(t.text or '' for t in text_nodes):
+            field_paragraphs.append([positions[t] for t in text_nodes])
+    return field_paragraphs
+
+def find_fields_in_document(element):
     """
     Find all bracketed fields in the Word document.
     
     Args:
-        doc: Word document object
+        element: Parsed XML of the main document part
         
     Returns:
         set: Set of unique field names found (without brackets)
     """
     fields = set()
-    pattern = r'\[([^\]]+)\]'
-    
-    # Search in paragraphs
-    for paragraph in doc.paragraphs:
-        matches = re.finditer(pattern, paragraph.text)
-        # Strip whitespace from field names
-        fields.update(match.group(1).strip() for match in matches)
-    
-    # Search in tables
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                matches = re.finditer(pattern, cell.text)
-                # Strip whitespace from field names
-                fields.update(match.group(1).strip() for match in matches)
+    
+    for text_nodes in _iter_paragraph_text_nodes(element):
+        text = ''.join(t.text or '' for t in text_nodes)
+        if '[' in text:
+            # Strip whitespace from field names
+            fields.update(name.strip() for _, _, name in _iter_fields(text))
     
     return fields
 
-def replace_fields_in_document(doc, data):
+def replace_fields_in_document(element, data, field_paragraphs=None):
     """
     Replace all bracketed fields with corresponding values while preserving formatting.
     
+    Works on the document XML directly rather than through python-docx's
+    Paragraph and Run objects, which re-read the XML on every access.
+    
     Args:
-        doc: Word document object
+        element: Parsed XML of the main document part, modified in place
         data (dict): Dictionary of field names and their values
+        field_paragraphs (list, optional): Result of find_field_paragraphs for
+            this document or the template it was copied from. When omitted,
+            every paragraph is checked.
     """
-    # Create a mapping of field names to values (strip whitespace from keys)
+    # Create a mapping of field names to values (strip whitespace from keys).
+    # Values are converted to strings here, once per document.
     field_mapping = {}
     for key, value in data.items():
         # Handle None keys
         if key is not None:
-            field_mapping[key.strip()] = value if value is not None else ''
+            field_mapping[key.strip()] = str(value) if value is not None else ''
     
-    # Process paragraphs
-    for paragraph in doc.paragraphs:
-        replace_fields_in_paragraph(paragraph, field_mapping)
+    if field_paragraphs is None:
+        for text_nodes in _iter_paragraph_text_nodes(element):
+            replace_fields_in_paragraph(text_nodes, field_mapping)
+        return
     
-    # Process tables
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for paragraph in cell.paragraphs:
-                    replace_fields_in_paragraph(paragraph, field_mapping)
+    all_text_nodes = list(element.iter(W_T))
+    for positions in field_paragraphs:
+        replace_fields_in_paragraph([all_text_nodes[i] for i in positions], field_mapping)
 
-def replace_fields_in_paragraph(paragraph, field_mapping):
+def replace_fields_in_paragraph(text_nodes, field_mapping):
     """
     Replace fields in a paragraph while preserving formatting.
     
+    When every field sits inside a single text node, each node is rewritten on
+    its own. Otherwise the paragraph text is scanned once and each field is
+    mapped back to the node(s) it occupies using the cumulative node lengths,
+    so fields split across runs (e.g. run1="Hello [First", run2=" Name]") are
+    handled in the same pass.
+    
     Args:
-        paragraph: Paragraph object
-        field_mapping (dict): Dictionary mapping field names to values
+        text_nodes (list): The paragraph's w:t elements, in order
+        field_mapping (dict): Dictionary mapping field names to string values
     """
-    # Pattern to find field placeholders
-    pattern = r'\[([^\]]+)\]'
-    
-    # Check if paragraph contains any fields that match our field_mapping
-    # If not, we can exit early
-    paragraph_has_fields = False
-    for match in re.finditer(pattern, paragraph.text):
-        # Get field name and strip whitespace
-        field_name = match.group(1).strip()
-        if field_name in field_mapping:
-            paragraph_has_fields = True
-            break
-            
-    if not paragraph_has_fields:
+    original_texts = [t.text or '' for t in text_nodes]
+    full_text = ''.join(original_texts)
+    if '[' not in full_text:
         return
     
-    # Get all field matches in this paragraph
-    field_matches = list(re.finditer(pattern, paragraph.text))
+    # Common case: no field is split across nodes. A field can only continue
+    # into the next node if some node has a '[' with no ']' after it, so when
+    # every node is closed each one can be handled on its own.
+    if all(text.rfind('[') < text.rfind(']') for text in original_texts if '[' in text):
+        for t, text in zip(text_nodes, original_texts):
+            if '[' in text:
+                new_text = _replace_fields_in_text(text, field_mapping)
+                if new_text != text:
+                    _write_text(t, new_text)
+        return
     
-    # If no matches, return
-    if not field_matches:
+    # Only keep fields that we have values for
+    matches = []
+    for start, end, name in _iter_fields(full_text):
+        name = name.strip()
+        if name in field_mapping:
+            matches.append((start, end, name))
+    if not matches:
         return
     
-    # Process each run, preserving formatting
-    for run_index, run in enumerate(paragraph.runs):
-        # Find all fields in this run
-        run_matches = list(re.finditer(pattern, run.text))
-        for match in run_matches:
-            # Get field name and strip whitespace
-            field_name = match.group(1).strip()
-            if field_name in field_mapping:
-                # Replace the field while preserving the run's formatting
-                field_text = match.group(0)  # The full field, e.g., "[First Name]"
-                value = field_mapping[field_name]
-                run.text = run.text.replace(field_text, str(value))
-    
-    # Check if any fields were broken across runs and fix them
-    # This happens when a field like [First Name] is split across multiple runs
-    # For example: run1="Hello [First", run2=" Name]"
-    remaining_text = paragraph.text
-    merged_runs = []
-    
-    # Find any remaining fields that might be split across runs
-    split_fields = re.finditer(pattern, remaining_text)
-    for match in split_fields:
-        field_text = match.group(0)  # e.g., "[First Name]"
-        field_name = match.group(1).strip()  # e.g., "First Name"
+    # node_ends[i] is the offset in full_text just past the end of node i
+    node_ends = list(accumulate(len(text) for text in original_texts))
+    node_texts = list(original_texts)
+    
+    # Work backwards so replacements never shift the offsets of earlier fields
+    for start, end, name in reversed(matches):
+        replacement = field_mapping[name]
+        start_node = bisect_right(node_ends, start)
+        end_node = bisect_right(node_ends, end - 1)
         
-        if field_name in field_mapping:
-            # Find the starting run that contains the beginning of the field
-            start_index = remaining_text.find(field_text)
-            if start_index >= 0:
-                # Calculate the runs that contain parts of this field
-                chars_so_far = 0
-                start_run = None
-                end_run = None
-                
-                for i, run in enumerate(paragraph.runs):
-                    run_length = len(run.text)
-                    
-                    # Check if this run contains the start of the field
-                    if start_run is None and chars_so_far <= start_index < chars_so_far + run_length:
-                        start_run = i
-                    
-                    # Check if this run contains the end of the field
-                    if start_run is not None and chars_so_far + run_length >= start_index + len(field_text):
-                        end_run = i
-                        break
-                    
-                    chars_so_far += run_length
-                
-                # If we found both start and end, and they're different (split across runs)
-                if start_run is not None and end_run is not None and start_run != end_run:
-                    # Record this split field for later processing
-                    merged_runs.append((start_run, end_run, field_text, str(field_mapping[field_name])))
-    
-    # Process any fields that were split across runs
-    for start_run, end_run, field_text, replacement in reversed(merged_runs):
-        # Extract the text from all affected runs
-        combined_text = ''.join(paragraph.runs[i].text for i in range(start_run, end_run + 1))
+        start_offset = start - (node_ends[start_node] - len(original_texts[start_node]))
+        end_offset = end - (node_ends[end_node] - len(original_texts[end_node]))
         
-        # Replace the field in the combined text
-        new_text = combined_text.replace(field_text, replacement)
+        # The field text goes into the first node (keeping its run's formatting)
+        # along with whatever followed the field in the last node; the rest are cleared
+        node_texts[start_node] = (node_texts[start_node][:start_offset] + replacement
+                                  + node_texts[end_node][end_offset:])
+        for i in range(start_node + 1, end_node + 1):
+            node_texts[i] = ''
+    
+    # Only touch nodes whose text actually changed
+    for t, old_text, new_text in zip(text_nodes, original_texts, node_texts):
+        if new_text != old_text:
+            _write_text(t, new_text)
+
+def read_template_parts(template_bytes):
+    """
+    Split a .docx template into its zip entries and parse the main document part.
+    
+    Args:
+        template_bytes (bytes): Contents of the .docx file
         
-        # Put the text in the first run and clear others
-        paragraph.runs[start_run].text = new_text
-        for i in range(start_run + 1, end_run + 1):
-            paragraph.runs[i].text = ''
+    Returns:
+        tuple: (entries, document_part, document_element) where entries is a
+            list of (ZipInfo, bytes) for every zip entry in its original order,
+            document_part is the entry name of the main document (normally
+            word/document.xml) and document_element is its parsed XML
+    """
+    with zipfile.ZipFile(io.BytesIO(template_bytes)) as zf:
+        entries = [(info, zf.read(info)) for info in zf.infolist()]
+    parts = {info.filename: data for info, data in entries}
+    
+    # The package relationships name the main document part
+    document_part = None
+    for rel in etree.fromstring(parts['_rels/.rels']):
+        if rel.get('Type', '').endswith('/officeDocument'):
+            document_part = rel.get('Target').lstrip('/')
+            break
+    if document_part not in parts:
+        raise ValueError("Word document has no main document part")
+    
+    return entries, document_part, parse_xml(parts[document_part])
+
+def write_docx(file, entries, replaced_parts, compress_level=DOCX_COMPRESSION_LEVEL):
+    """
+    Write a .docx package from the template's zip entries.
+    
+    Each entry keeps the template's timestamp and compression method, so parts
+    the template stores uncompressed (usually images, which deflate cannot
+    shrink) are copied without running them through zlib.
+    
+    Args:
+        file: Path or writable binary file object
+        entries (list): (ZipInfo, bytes) for every zip entry, as from read_template_parts
+        replaced_parts (dict): New contents for the entries that changed, by name
+        compress_level (int): Deflate level (0-9) for compressed entries
+    """
+    with zipfile.ZipFile(file, 'w') as zf:
+        for info, data in entries:
+            # Build a new ZipInfo so the template's own entries are never modified
+            entry = zipfile.ZipInfo(info.filename, info.date_time)
+            entry.external_attr = info.external_attr
+            if info.compress_type == zipfile.ZIP_STORED:
+                entry.compress_type = zipfile.ZIP_STORED
+            else:
+                entry.compress_type = zipfile.ZIP_DEFLATED
+            zf.writestr(entry, replaced_parts.get(info.filename, data),
+                        compresslevel=compress_level)
+
+def _prepare_template(template_bytes, template_parts, compress_level, field_names):
+    """
+    Build the per-worker template state used by _process_row.
+    
+    Args:
+        template_bytes (bytes): Contents of the .docx template
+        template_parts (tuple): Result of read_template_parts(template_bytes)
+        compress_level (int): Deflate level for saved documents
+        field_names (list): Template field names, in the order rows send their values
+        
+    Returns:
+        tuple: Template state for _worker_template
+    """
+    entries, document_part, document_element = template_parts
+    
+    # With no '[' in any paragraph there is nothing to fill, so every output
+    # can simply be a copy of the template file
+    field_paragraphs = find_field_paragraphs(document_element)
+    if not field_paragraphs:
+        document_element = None
+    
+    return (template_bytes, entries, document_part, document_element,
+            field_paragraphs, compress_level, field_names)
+
+def _init_worker(template_bytes, compress_level, field_names):
+    """Set up a worker process: parse the template once and start its save threads."""
+    global _worker_template, _worker_save_pool
+    # Forked workers inherit the template already parsed by the main process
+    if _worker_template is None:
+        _worker_template = _prepare_template(template_bytes, read_template_parts(template_bytes),
+                                             compress_level, field_names)
+    _worker_save_pool = ThreadPoolExecutor(max_workers=SAVE_THREADS_PER_WORKER)
+
+def _save_docx(docx_path, entries, replaced_parts, compress_level, start_time):
+    """
+    Zip and write one filled document. Runs on a worker's save thread.
+    
+    Args:
+        docx_path (str): Path to save the document
+        entries (list): Template zip entries, as from read_template_parts
+        replaced_parts (dict): New contents for the entries that changed, by name
+        compress_level (int): Deflate level for compressed entries
+        start_time (float): When work on the row started
+        
+    Returns:
+        tuple: (docx_path, elapsed_time)
+    """
+    # Build the zip in memory so the file is written with a single call
+    buffer = io.BytesIO()
+    write_docx(buffer, entries, replaced_parts, compress_level)
+    with open(docx_path, 'wb') as f:
+        f.write(buffer.getbuffer())
+    return docx_path, time.time() - start_time
+
+def _copy_template(docx_path, template_bytes, start_time):
+    """Write an unchanged copy of the template. Runs on a worker's save thread."""
+    with open(docx_path, 'wb') as f:
+        f.write(template_bytes)
+    return docx_path, time.time() - start_time
+
+def _process_row(values, docx_path):
+    """
+    Fill one copy of the template and queue it to be saved. Runs in a worker process.
+    
+    Args:
+        values (list): Raw Excel values of the template fields, in the order
+            of the field names given to _init_worker
+        docx_path (str): Path to save the filled document
+        
+    Returns:
+        Future: Resolves to (docx_path, elapsed_time) once the file is written
+    """
+    start_time = time.time()
+    (template_bytes, entries, document_part, document_element,
+     field_paragraphs, compress_level, field_names) = _worker_template
+    
+    if document_element is None:
+        return _worker_save_pool.submit(_copy_template, docx_path, template_bytes, start_time)
+    
+    # Values are formatted here, in parallel, rather than in the main process
+    data = {}
+    for name, value in zip(field_names, values):
+        # Empty and text cells are by far the most common, so handle
+        # them without a formatting call
+        if value is None:
+            data[name] = ''
+        elif isinstance(value, str):
+            data[name] = value
+        else:
+            data[name] = format_excel_value(value)
+    
+    # Fill a copy of the already-parsed document XML. Every other part of
+    # the template is written out from its original bytes without being parsed.
+    element = copy.deepcopy(document_element)
+    replace_fields_in_document(element, data, field_paragraphs)
+    
+    # Compression and file writes release the GIL, so saving on a thread
+    # overlaps with filling the next row
+    return _worker_save_pool.submit(_save_docx, docx_path, entries,
+                                    {document_part: serialize_part_xml(element)},
+                                    compress_level, start_time)
+
+def _process_rows(batch):
+    """
+    Fill and save a batch of rows. Runs in a worker process.
+    
+    Args:
+        batch (list): List of (row_number, values, docx_path) tuples
+    
+    Returns:
+        list: (docx_path, elapsed_time) for each row in the batch
+    """
+    saves = []
+    for row_number, values, docx_path in batch:
+        try:
+            saves.append((row_number, _process_row(values, docx_path)))
+        except Exception as e:
+            # Let the main process report which row failed
+            e.row_number = row_number
+            raise
+    
+    # Wait for every save in the batch so errors reach the main process
+    results = []
+    for row_number, save in saves:
+        try:
+            results.append(save.result())
+        except Exception as e:
+            e.row_number = row_number
+            raise
+    return results
 
 def fill_docx_templates(config):
     """
@@ -209,6 +533,8 @@ def fill_docx_templates(config):
             - output_directory: Directory for output files
             - filename_field1: Optional field for filename generation
             - filename_field2: Optional field for filename generation
+            - max_workers: Optional number of worker processes (default: CPU count)
+            - compress_level: Optional zip deflate level 0-9 (default: 1)
         
     Returns:
         tuple: (success_count, total_files) indicating number of successfully processed files
@@ -217,49 +543,60 @@ def fill_docx_templates(config):
         FileNotFoundError: If the template or Excel file doesn't exist
         ValueError: If there are fields in the template not found in Excel
     """
+    global _worker_template
+    
     # Extract configuration
     excel_file = config['excel_file']
     word_template = config['template']
     output_directory = config['output_directory']
     filename_field1 = config.get('filename_field1', '')
     filename_field2 = config.get('filename_field2', '')
+    max_workers = int(config.get('max_workers') or os.cpu_count() or 1)
+    compress_level = int(config.get('compress_level') or DOCX_COMPRESSION_LEVEL)
+    if not 0 <= compress_level <= 9:
+        raise ValueError(f"compress_level must be between 0 and 9, got {compress_level}")
     
     # Create output directory if it doesn't exist
     os.makedirs(output_directory, exist_ok=True)
     
-    # Verify template file exists
-    if not os.path.exists(word_template):
-        raise FileNotFoundError(f"Word template file not found: {word_template}")
-        
-    # Verify Excel file exists
-    if not os.path.exists(excel_file):
-        raise FileNotFoundError(f"Excel file not found: {excel_file}")
+    # Read the template into memory once so each row can be built from these
+    # bytes instead of re-opening the file from disk
+    try:
+        with open(word_template, 'rb') as f:
+            template_bytes = f.read()
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Word template file not found: {word_template}") from e
     
-    # Load the template to find fields
+    # Parse the template's document XML to find fields
     try:
-        template_doc = Document(word_template)
-    except Exception as e:
-        # Convert cryptic "Package not found" error to something more meaningful
-        if "Package not found" in str(e):
-            raise ValueError(f"Invalid or corrupted Word document: {word_template}")
-        raise
-    
-    template_fields = find_fields_in_document(template_doc)
+        template_parts = read_template_parts(template_bytes)
+    except (zipfile.BadZipFile, KeyError):
+        raise ValueError(f"Invalid or corrupted Word document: {word_template}")
+    
+    template_fields = find_fields_in_document(template_parts[2])
     print(f"\nFound {len(template_fields)} unique fields in Word template:")
     print(", ".join(sorted(template_fields)))
     
-    # Read Excel data
-    wb = load_workbook(filename=excel_file, data_only=True)
+    # Read Excel data. Read-only mode streams the sheet instead of building
+    # the full cell model, which is much faster on large workbooks.
+    try:
+        wb = load_workbook(filename=excel_file, data_only=True, read_only=True)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Excel file not found: {excel_file}") from e
     ws = wb.active
-    headers = [cell.value for cell in ws[1]]
+    
+    rows = ws.iter_rows()
+    headers = [cell.value for cell in next(rows, ())]
+    
+    # Resolve each stripped header name to its column index once; every
+    # lookup below uses this. When a name repeats, the last column wins,
+    # matching how the per-row dictionary was filled previously.
+    header_columns = {header.strip(): i for i, header in enumerate(headers) if header is not None}
     
     # Verify all template fields exist in Excel headers
     missing_fields = []
-    # Strip whitespace from all headers for consistent comparison
-    stripped_headers = [h.strip() if h is not None else '' for h in headers]
-    
     for field in template_fields:
-        if field not in stripped_headers:
+        if field not in header_columns:
             missing_fields.append(field)
     
     if missing_fields:
@@ -268,76 +605,131 @@ def fill_docx_templates(config):
     # Verify filename fields exist in headers if specified
     if filename_field1:
         filename_field1 = filename_field1.strip()
-        if filename_field1 not in stripped_headers:
+        if filename_field1 not in header_columns:
             raise ValueError(f"Specified filename field '{filename_field1}' not found in Excel headers")
         
     if filename_field2:
         filename_field2 = filename_field2.strip()
-        if filename_field2 not in stripped_headers:
+        if filename_field2 not in header_columns:
             raise ValueError(f"Specified filename field '{filename_field2}' not found in Excel headers")
     
-    # Create a mapping from stripped headers to original headers
-    header_mapping = {h.strip() if h is not None else '': h for h in headers}
-    
     if not filename_field1 and not filename_field2:
         print("No filename fields specified - using timestamps for output files")
     
-    # Count total non-empty rows
-    total_files = sum(1 for row in ws.iter_rows(min_row=2) if any(cell.value for cell in row))
+    # Only the template fields and filename fields are ever read from a row,
+    # so resolve their columns once and skip every other column per row
+    template_columns = sorted((header_columns[field], field) for field in template_fields
+                              if field in header_columns)
+    filename_columns = [header_columns[field] for field in (filename_field1, filename_field2) if field]
+    
+    # Rows are sent to the workers as plain lists of values. The field names
+    # (interned, as they become dictionary keys in every row) are sent once,
+    # when each worker starts.
+    template_indices = [i for i, _ in template_columns]
+    template_field_names = [sys.intern(field) for _, field in template_columns]
+    
+    # Columns whose dates may need their number format checked
+    used_columns = sorted(set(template_indices).union(filename_columns))
+    
     processed_count = 0
     success_count = 0
     
-    # Process each row
-    for row_cells in ws.iter_rows(min_row=2):
-        row = [cell.value for cell in row_cells]
-        if not any(row):  # Skip empty rows
-            continue
-        
-        processed_count += 1
-        start_time = time.time()
-        
-        try:
-            # Create data dictionary
-            data = {}
-            for i, cell in enumerate(row_cells):
-                if i < len(headers):
-                    header = headers[i]
-                    if header is not None:
-                        data[header.strip()] = format_excel_cell_date(cell)
-            
-            # Generate output filename from specified fields
-            if filename_field1 or filename_field2:
-                # Use empty string if the value is None or not in the data dictionary
-                field1_value = str(data.get(filename_field1) or '').strip()
-                field2_value = str(data.get(filename_field2) or '').strip()
-                filename = f"{field1_value} {field2_value}".strip()
-            else:
-                # Use timestamp if no fields specified
-                filename = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
-            
-            # Sanitize filename
-            filename = sanitize_filename(filename)
-            
-            # Create output path and handle duplicates
-            base_path = os.path.join(output_directory, filename)
-            docx_path = get_unique_filename(base_path, "docx")
+    # Names of the files already in the output directory, plus those handed
+    # out to rows as they are read, so duplicates are found without a
+    # filesystem check per name
+    reserved_names = list_filenames(output_directory)
+    
+    mp_context = None
+    if sys.platform.startswith('linux'):
+        # Forked workers share the template parsed here instead of each
+        # parsing it again. macOS and Windows keep their default start method,
+        # as fork is unsafe on macOS and unavailable on Windows.
+        mp_context = multiprocessing.get_context('fork')
+        _worker_template = _prepare_template(template_bytes, template_parts, compress_level,
+                                             template_field_names)
+    
+    max_workers = max(1, max_workers)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context, initializer=_init_worker,
+                                 initargs=(template_bytes, compress_level, template_field_names)) as executor:
+            # Build each row's data and output path here, then hand the document
+            # work to the pool
+            tasks = []
+            for row_cells in rows:
+                row = [cell.value for cell in row_cells]
+                if not any(row):  # Skip empty rows
+                    continue
+                
+                processed_count += 1
+                
+                # Read-only rows may omit trailing empty cells
+                if len(row) < len(headers):
+                    row.extend([None] * (len(headers) - len(row)))
+                
+                # A date-time shows its time only if its own cell's number format
+                # does, so those without one are sent as plain dates
+                for i in used_columns:
+                    value = row[i]
+                    if isinstance(value, dt.datetime) and not number_format_includes_time(row_cells[i].number_format):
+                        row[i] = value.date()
+                
+                # Raw values of the template fields; the workers format them
+                values = [row[i] for i in template_indices]
+                
+                # Generate output filename from specified fields
+                if filename_columns:
+                    # Empty cells become empty strings
+                    filename = " ".join(format_excel_value(row[i]).strip()
+                                        for i in filename_columns).strip()
+                else:
+                    # Use timestamp if no fields specified
+                    filename = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
+                
+                # Sanitize filename
+                filename = sanitize_filename(filename)
+                
+                # Create output path and handle duplicates
+                base_path = os.path.join(output_directory, filename)
+                docx_path = get_unique_filename(base_path, "docx", reserved_names)
+                
+                tasks.append((processed_count, values, docx_path))
             
-            # Create and save the filled document
-            doc = Document(word_template)
-            replace_fields_in_document(doc, data)
-            doc.save(docx_path)
+            # Every non-empty row has been read, so the sheet is only scanned once.
+            # Read-only workbooks keep the file open until closed.
+            wb.close()
+            total_files = len(tasks)
             
-            success_count += 1
-            elapsed_time = time.time() - start_time
-            print(f"Processed {processed_count}/{total_files}: {os.path.basename(docx_path)} in {elapsed_time:.1f} seconds")
+            # Send rows in batches, keeping several batches per worker so the load
+            # stays balanced on small runs
+            rows_per_task = max(1, min(MAX_ROWS_PER_TASK, total_files // (max_workers * 4)))
+            future_to_batch = {}
+            for i in range(0, total_files, rows_per_task):
+                batch = tasks[i:i + rows_per_task]
+                future_to_batch[executor.submit(_process_rows, batch)] = batch
             
-        except Exception as e:
-            # Log the error
-            print(f"Error processing row {processed_count}: {str(e)}")
-            print("Stack trace:")
-            traceback.print_exc()
-            # Re-raise the exception to propagate it
-            raise
+            # Report progress as batches complete
+            for future in as_completed(future_to_batch):
+                try:
+                    results = future.result()
+                except Exception as e:
+                    # Log the error
+                    row_number = getattr(e, 'row_number', future_to_batch[future][0][0])
+                    print(f"Error processing row {row_number}: {type(e).__name__}: {str(e)}")
+                    if DEBUG:
+                        print("Stack trace:")
+                        traceback.print_exc()
+                    # Stop any rows that have not started, then re-raise
+                    for pending in future_to_batch:
+                        pending.cancel()
+                    raise
+                
+                for docx_path, elapsed_time in results:
+                    success_count += 1
+                    print(f"Processed {success_count}/{total_files}: {os.path.basename(docx_path)} in {elapsed_time:.1f} seconds")
+    finally:
+        # The main process has no further use for the template state, even
+        # if a row failed
+        _worker_template = None
     
     # Print summary
     print("\nProcessing Summary:")
@@ -9,155 +9,472 @@ Requirements:
     - Python packages:
         Windows: pip install pywin32
         macOS: pip install pyobjc
+    - Or, for --engine=libreoffice (any platform), LibreOffice must be installed
 
 Usage:
-    python docx_to_pdf.py <directory_path> [max_threads]
+    python docx_to_pdf.py <directory_path> [max_threads] [--force] [--engine=word|libreoffice]
 
 Example:
     python docx_to_pdf.py /path/to/documents
     python docx_to_pdf.py /path/to/documents 4  # Use 4 threads for conversion
+    python docx_to_pdf.py /path/to/documents --force  # Reconvert up-to-date files too
+    python docx_to_pdf.py /path/to/documents 4 --engine=libreoffice  # Convert with LibreOffice
 
 Note:
     - The script will maintain the original .docx files
     - PDFs will be created in a 'pdf_exports' subdirectory
-    - If a PDF with the same name already exists, it will be overwritten
+    - Documents whose PDF already exists and is newer than the .docx are skipped
+      (pass --force to convert them anyway); older PDFs are overwritten
     - Files in subdirectories are not processed (only top-level directory)
     - By default, a single Word instance is used (recommended for best performance)
-    - Multiple threads can be specified but may not improve performance
+    - Multiple threads can be specified but may not improve performance; the
+      count is capped at the number of files, CPU cores and 8, since Word
+      conversions stop scaling once every core is busy
+    - Word is used by default; LibreOffice is used when Word automation isn't
+      available (e.g. on Linux) and LibreOffice is installed
 """
 
 import sys
 import os
+import atexit
+import shutil
+import tempfile
+import zipfile
 import time
 import platform
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import subprocess
+import queue
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from libreoffice_docx_to_pdf import convert_docx_to_pdf, get_libreoffice_cmd, pdf_stat, pdf_written
 
-def check_dependencies():
-    """Check that platform-specific dependencies are installed."""
-    system = platform.system()
-    
-    if system == 'Windows':
-        try:
-            # Check if pywin32 is installed
+# Operating system name, looked up once
+SYSTEM = platform.system()
+
+def word_dependencies_installed():
+    """Check, without printing anything, whether Word automation can be used here."""
+    try:
+        if SYSTEM == 'Windows':
             import win32com.client
             import pythoncom
             return True
-        except ImportError:
-            print("\nERROR: Required package 'pywin32' is not installed!")
-            print("Please install it using the following command:")
-            print("    pip install pywin32")
-            print("\nThis package is required for Word automation on Windows.")
-            return False
-    
-    elif system == 'Darwin':  # macOS
-        try:
-            # Check if pyobjc is installed
+        if SYSTEM == 'Darwin':  # macOS
             import objc
             return True
-        except ImportError:
-            print("\nERROR: Required package 'pyobjc' is not installed!")
-            print("Please install it using the following command:")
-            print("    pip install pyobjc")
-            print("\nThis package is required for Word automation on macOS.")
-            return False
+    except ImportError:
+        pass
+    return False
+
+def check_dependencies(engine='word'):
+    """
+    Check that the dependencies for a conversion engine are installed.
+    
+    Prints what is missing and how to install it.
+    
+    Args:
+        engine (str): 'word' (default) or 'libreoffice'
+        
+    Returns:
+        bool: True if the engine can be used
+    """
+    system = SYSTEM
+    
+    if engine == 'libreoffice':
+        if libreoffice_available():
+            return True
+        print("\nERROR: LibreOffice was not found!")
+        print("Install LibreOffice, or add 'soffice' to your PATH.")
+        return False
+    
+    if word_dependencies_installed():
+        return True
+    
+    if system == 'Windows':
+        print("\nERROR: Required package 'pywin32' is not installed!")
+        print("Please install it using the following command:")
+        print("    pip install pywin32")
+        print("\nThis package is required for Word automation on Windows.")
+    
+    elif system == 'Darwin':  # macOS
+        print("\nERROR: Required package 'pyobjc' is not installed!")
+        print("Please install it using the following command:")
+        print("    pip install pyobjc")
+        print("\nThis package is required for Word automation on macOS.")
     
     else:
         print(f"\nERROR: Unsupported operating system: {system}")
-        print("This script only supports Windows and macOS.")
+        print("Word automation is only supported on Windows and macOS.")
         if system == 'Linux':
-            print("For Linux, consider using the LibreOffice conversion engine instead.")
+            print("For Linux, use the LibreOffice conversion engine instead (--engine=libreoffice).")
+    return False
+
+def libreoffice_available():
+    """Check whether LibreOffice can be found for the LibreOffice engine."""
+    libreoffice_cmd = get_libreoffice_cmd()
+    return os.path.exists(libreoffice_cmd) or shutil.which(libreoffice_cmd) is not None
+
+# Whether Word automation's Python packages are installed. Checked quietly
+# here; main() reports what's missing for the engine actually used.
+dependencies_ok = word_dependencies_installed()
+
+# Upper limit on parallel Word or LibreOffice instances
+MAX_WORKERS = 8
+
+# GetDriveTypeW result for a network drive
+DRIVE_REMOTE = 4
+
+# Word's WdExportFormat value for PDF
+WD_EXPORT_FORMAT_PDF = 17
+
+def dispatch_word(early_bound=True):
+    """
+    Start a Word instance through an early-bound COM proxy.
+    
+    gencache.EnsureDispatch generates typed wrappers for Word's type library
+    (once, then cached on disk), so method calls go straight to their DISPIDs
+    instead of looking each name up at call time. Falls back to late binding
+    if the wrappers cannot be generated.
+    
+    Args:
+        early_bound (bool, optional): Use the typed wrappers; pass False for
+                                      plain late binding
+        
+    Returns:
+        Word Application COM object
+    """
+    import win32com.client
+    
+    if early_bound:
+        try:
+            return win32com.client.gencache.EnsureDispatch("Word.Application")
+        except Exception:
+            pass
+    return win32com.client.Dispatch("Word.Application")
+
+def prepare_word_wrappers():
+    """
+    Generate the typed wrappers for Word once, before worker processes start.
+    
+    pywin32 can corrupt its gen_py cache if several processes generate it at
+    the same time, so the pool workers only use early binding once the cache
+    has been built here.
+    
+    Returns:
+        bool: True if the wrappers are in the cache
+    """
+    import win32com.client
+    
+    try:
+        if win32com.client.gencache.GetClassForProgID("Word.Application") is None:
+            win32com.client.gencache.EnsureDispatch("Word.Application").Quit()
+        return True
+    except Exception:
         return False
 
-# Check dependencies before proceeding
-dependencies_ok = check_dependencies()
+def export_pdf_windows(doc, pdf_path):
+    """
+    Export an open Word document to PDF.
+    
+    Calls Word's PDF exporter directly rather than going through SaveAs,
+    which runs the full save pipeline and renames the open document.
+    
+    Args:
+        doc: Word Document COM object
+        pdf_path (str): Path for the PDF file
+    """
+    doc.ExportAsFixedFormat(OutputFileName=pdf_path, ExportFormat=WD_EXPORT_FORMAT_PDF,
+                            OpenAfterExport=False, OptimizeFor=0, CreateBookmarks=0,
+                            DocStructureTags=False, BitmapMissingFonts=True)
 
-def convert_to_pdf_windows_batch(docx_files, pdf_dir, max_workers=4):
-    """Convert multiple Word documents to PDF using a pool of persistent Word instances."""
-    total_files = len(docx_files)
-    success_count = 0
-    results = []
+# Word options switched off while converting: prompts, background printing,
+# and the background spelling, grammar and repagination passes Word runs on
+# open documents. They are saved in the user's settings, so quit_word puts
+# the old values back; a Word instance killed before it quits keeps them.
+WORD_CONVERSION_OPTIONS = {
+    'SavePropertiesPrompt': False,
+    'CheckSpellingAsYouType': False,
+    'CheckGrammarAsYouType': False,
+    'Pagination': False,
+    'PrintBackground': False,
+}
+
+# msoAutomationSecurityForceDisable: never run macros in opened documents
+MSO_AUTOMATION_SECURITY_FORCE_DISABLE = 3
+
+def configure_word(word, original_options):
+    """
+    Set up a Word instance for unattended conversion.
     
-    def process_document_batch(file_batch):
-        """Process a batch of documents using a single Word instance."""
-        thread_results = []
-        thread_success = 0
+    Each option's original value is recorded in original_options before it
+    is changed, so quit_word can put back whatever was changed even if this
+    fails part way.
+    
+    Args:
+        word: Word Application COM object
+        original_options (dict): Receives the original values of the
+                                 options that are changed
+    """
+    word.Visible = False  # Hide Word
+    word.DisplayAlerts = 0  # Never wait on a dialog
+    word.ScreenUpdating = False
+    word.AutomationSecurity = MSO_AUTOMATION_SECURITY_FORCE_DISABLE
+    
+    for name, value in WORD_CONVERSION_OPTIONS.items():
+        original_options[name] = getattr(word.Options, name)
+        setattr(word.Options, name, value)
+
+def quit_word(word, original_options):
+    """
+    Restore the options changed by configure_word and quit Word.
+    
+    Args:
+        word: Word Application COM object
+        original_options (dict): Option values recorded by configure_word
+    """
+    for name, value in original_options.items():
+        try:
+            setattr(word.Options, name, value)
+        except:
+            pass
+    try:
+        word.Quit()
+    except:
+        pass
+
+def open_document_windows(word, docx_path):
+    """
+    Open a Word document for export only.
+    
+    Opens it read-only and hidden, without adding it to the recent files
+    list, converting formats or asking about encodings.
+    
+    Args:
+        word: Word Application COM object
+        docx_path (str): Path to the Word document
         
-        import win32com.client
-        import pywintypes
-        import pythoncom  # Import pythoncom module for COM initialization
+    Returns:
+        Word Document COM object
+    """
+    return word.Documents.Open(FileName=docx_path, ConfirmConversions=False, ReadOnly=True,
+                               AddToRecentFiles=False, Revert=True, Visible=False,
+                               OpenAndRepair=False, NoEncodingDialog=True)
+
+def _pdf_path_for(docx_path, pdf_dir):
+    """Return the path of the PDF a Word document is converted to."""
+    return os.path.join(pdf_dir, os.path.splitext(os.path.basename(docx_path))[0] + ".pdf")
+
+def is_network_path(path):
+    """
+    Check whether a path is on a network share.
+    
+    Only detects Windows UNC paths and mapped network drives.
+    
+    Args:
+        path (str): Path to check
         
-        # Initialize COM for this thread
-        pythoncom.CoInitialize()
+    Returns:
+        bool: True if the path is on a network share
+    """
+    if SYSTEM != 'Windows':
+        return False
+    path = os.path.abspath(path)
+    if path.startswith('\\\\'):
+        return True
+    
+    import ctypes
+    drive = os.path.splitdrive(path)[0]
+    return ctypes.windll.kernel32.GetDriveTypeW(drive + '\\') == DRIVE_REMOTE
+
+def _move_exported_pdf(export_path, pdf_path, result, total_files, report):
+    """Move a PDF exported to the staging directory into place, then report it."""
+    index = result[0]
+    try:
+        shutil.move(export_path, pdf_path)
+    except OSError as e:
+        result = (index, False, f"[{index}/{total_files}] Error moving {os.path.basename(pdf_path)} into place: {str(e)}")
+    report(result)
+
+def convert_documents_windows(word, documents, total_files, report, stage_output=False):
+    """
+    Convert documents to PDF one after another with an open Word instance.
+    
+    Args:
+        word: Word Application COM object, set up by configure_word
+        documents: Iterable of (index, .docx path, .pdf path) tuples to convert
+        total_files (int): Total number of files, for progress messages
+        report (callable): Called with an (index, success, message) tuple
+                           as each document finishes
+        stage_output (bool, optional): Export to a local temporary directory and
+                                       move each PDF into place on a background
+                                       thread, so Word can start on the next
+                                       document while a slow share is written
+    """
+    import pywintypes
+    
+    staging_dir = tempfile.mkdtemp(prefix='docx_to_pdf_') if stage_output else None
+    mover = ThreadPoolExecutor(max_workers=1) if stage_output else None
+    try:
+        for index, docx_path, pdf_path in documents:
+            start_time = time.perf_counter()
+            try:
+                doc = open_document_windows(word, docx_path)
+                export_path = os.path.join(staging_dir, os.path.basename(pdf_path)) if staging_dir else pdf_path
+                export_pdf_windows(doc, export_path)
+                doc.Close(SaveChanges=False)
+                
+                elapsed_time = time.perf_counter() - start_time
+                message = f"[{index}/{total_files}] Successfully converted {os.path.basename(docx_path)} in {elapsed_time:.1f} seconds"
+                if mover:
+                    mover.submit(_move_exported_pdf, export_path, pdf_path, (index, True, message), total_files, report)
+                else:
+                    report((index, True, message))
+            except pywintypes.com_error as e:
+                elapsed_time = time.perf_counter() - start_time
+                message = f"[{index}/{total_files}] COM Error converting {os.path.basename(docx_path)}: {str(e)} in {elapsed_time:.1f} seconds"
+                report((index, False, message))
+            except Exception as e:
+                elapsed_time = time.perf_counter() - start_time
+                message = f"[{index}/{total_files}] Error converting {os.path.basename(docx_path)}: {str(e)} in {elapsed_time:.1f} seconds"
+                report((index, False, message))
+    finally:
+        # Wait for the last moves before cleaning up the staging directory
+        if mover:
+            mover.shutdown(wait=True)
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+def process_documents_windows(work_queue, total_files, result_queue, stage_output=False, early_bound=False):
+    """
+    Convert documents taken from a shared queue using a single Word instance.
+    
+    Runs in its own worker process, so every worker gets a private COM
+    apartment and Word instance instead of sharing the parent's. Workers
+    pull one document at a time until they reach a None marker, so a slow
+    document only holds up the worker converting it.
+    
+    Args:
+        work_queue: Queue of (index, .docx path, .pdf path) tuples to convert,
+                    followed by one None marker per worker
+        total_files (int): Total number of files, for progress messages
+        result_queue: Queue that receives an (index, success, message) tuple
+                      as each document finishes
+        stage_output (bool, optional): Stage PDFs locally before moving them
+                                       into place (see convert_documents_windows)
+        early_bound (bool, optional): Use Word's typed wrappers, which must
+                                      already be in the cache (see
+                                      prepare_word_wrappers)
+    """
+    import pythoncom  # Import pythoncom module for COM initialization
+    
+    # Initialize COM for this process in the multithreaded apartment. Only
+    # this thread ever touches the worker's Word objects, and Word runs out
+    # of process, so calls go straight through its proxy without the message
+    # loop marshalling a single-threaded apartment adds.
+    pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+    
+    word = None
+    original_options = {}
+    try:
+        # Create one Word instance for everything this worker converts
+        word = dispatch_word(early_bound)
+        configure_word(word, original_options)
         
-        word = None
+        # Process each document this worker takes with the same Word instance
+        convert_documents_windows(word, iter(work_queue.get, None), total_files, result_queue.put,
+                                  stage_output)
+    finally:
+        # Clean up Word instance when the queue is exhausted
+        if word:
+            quit_word(word, original_options)
+        # Uninitialize COM for this process
+        pythoncom.CoUninitialize()
+
+def _collect_results(result_queue, futures):
+    """
+    Print and gather per-document results as the workers report them.
+    
+    Args:
+        result_queue: Queue the workers put (index, success, message) tuples on
+        futures (list): Futures of the submitted workers
+        
+    Returns:
+        tuple: (list of (index, success, message), number of successes)
+    """
+    results = []
+    success_count = 0
+    
+    # Workers put every result before their future completes, so once all
+    # of them are done and the queue is empty nothing more can arrive
+    while True:
         try:
-            # Create one Word instance for this entire batch
-            word = win32com.client.Dispatch("Word.Application")
-            word.Visible = False  # Hide Word
-            
-            # Process each document in this batch with the same Word instance
-            for index, docx_path in file_batch:
-                start_time = time.time()
-                try:
-                    doc = word.Documents.Open(docx_path)
-                    pdf_path = os.path.join(pdf_dir, os.path.splitext(os.path.basename(docx_path))[0] + ".pdf")
-                    
-                    # PDF export options (17 is the PDF format code)
-                    doc.SaveAs(pdf_path, FileFormat=17)
-                    doc.Close(SaveChanges=False)
-                    
-                    elapsed_time = time.time() - start_time
-                    message = f"[{index}/{total_files}] Successfully converted {os.path.basename(docx_path)} in {elapsed_time:.1f} seconds"
-                    thread_success += 1
-                    thread_results.append((index, True, message))
-                    print(message)  # Print progress in real-time
-                except pywintypes.com_error as e:
-                    elapsed_time = time.time() - start_time
-                    message = f"[{index}/{total_files}] COM Error converting {os.path.basename(docx_path)}: {str(e)} in {elapsed_time:.1f} seconds"
-                    thread_results.append((index, False, message))
-                    print(message)  # Print progress in real-time
-                except Exception as e:
-                    elapsed_time = time.time() - start_time
-                    message = f"[{index}/{total_files}] Error converting {os.path.basename(docx_path)}: {str(e)} in {elapsed_time:.1f} seconds"
-                    thread_results.append((index, False, message))
-                    print(message)  # Print progress in real-time
-        finally:
-            # Clean up Word instance when the entire batch is done
-            if word:
-                try:
-                    word.Quit()
-                except:
-                    pass
-            # Uninitialize COM for this thread
-            pythoncom.CoUninitialize()
-        
-        return thread_results, thread_success
+            result = result_queue.get(timeout=0.5)
+        except queue.Empty:
+            if all(future.done() for future in futures):
+                break
+            continue
+        print(result[2])  # Print progress in real-time
+        results.append(result)
+        if result[1]:
+            success_count += 1
+    
+    for future in futures:
+        try:
+            future.result()
+        except Exception as e:
+            print(f"Error in parallel conversion: {str(e)}")
+            # Other workers carry on even if one fails
+    
+    return results, success_count
+
+def convert_to_pdf_windows_batch(docx_files, pdf_dir, max_workers=4):
+    """Convert multiple Word documents to PDF using a pool of persistent Word instances."""
+    total_files = len(docx_files)
+    success_count = 0
+    results = []
     
     try:
         print(f"Starting conversion with {max_workers} persistent Word instances...")
         
-        # Create indexed task list
-        indexed_files = [(i+1, docx_path) for i, docx_path in enumerate(docx_files)]
+        # Create indexed task list with each document's output path
+        indexed_files = [(i+1, docx_path, _pdf_path_for(docx_path, pdf_dir))
+                         for i, docx_path in enumerate(docx_files)]
         
-        # Split files into batches for each worker thread
-        batch_size = (len(docx_files) + max_workers - 1) // max_workers  # Ceiling division
-        batches = [indexed_files[i:i+batch_size] for i in range(0, len(indexed_files), batch_size)]
+        # On a network share, Word exports to a local directory and the PDFs
+        # are moved into place in the background
+        stage_output = is_network_path(pdf_dir)
         
-        # Process batches in parallel with ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all batches and collect futures
-            future_to_batch = {executor.submit(process_document_batch, batch): i for i, batch in enumerate(batches)}
+        if max_workers == 1:
+            # A single worker runs in this process on the shared Word from
+            # get_word(), which stays open until exit, so later calls from the
+            # same process (e.g. a script watching a folder) skip Word's startup
+            def report(result):
+                print(result[2])  # Print progress in real-time
+                results.append(result)
+            
+            convert_documents_windows(get_word(), indexed_files, total_files, report, stage_output)
+            success_count = sum(1 for result in results if result[1])
+            return success_count, total_files
+        
+        # Convert in parallel with ProcessPoolExecutor. Word is a
+        # single-threaded COM server, so worker threads in one process end up
+        # serialized on it; separate processes each drive their own instance.
+        # Workers take documents from a shared queue rather than fixed
+        # batches, and results stream back through a bounded queue.
+        max_workers = max(1, min(max_workers, total_files))
+        early_bound = prepare_word_wrappers()
+        with multiprocessing.Manager() as manager, ProcessPoolExecutor(max_workers=max_workers) as executor:
+            work_queue = manager.Queue()
+            for item in indexed_files:
+                work_queue.put(item)
+            for _ in range(max_workers):
+                work_queue.put(None)
             
-            # Process results as they complete
-            for future in as_completed(future_to_batch):
-                try:
-                    batch_results, batch_success = future.result()
-                    results.extend(batch_results)
-                    success_count += batch_success
-                except Exception as e:
-                    print(f"Error in parallel conversion: {str(e)}")
-                    # Continue processing other batches even if one fails
+            result_queue = manager.Queue(maxsize=max_workers * 4)
+            futures = [executor.submit(process_documents_windows, work_queue, total_files, result_queue,
+                                       stage_output, early_bound)
+                       for _ in range(max_workers)]
+            results, success_count = _collect_results(result_queue, futures)
     
     except Exception as e:
         print(f"Error in parallel conversion: {str(e)}")
@@ -165,14 +482,143 @@ def convert_to_pdf_windows_batch(docx_files, pdf_dir, max_workers=4):
     # Sort results by index for consistent output order
     results.sort(key=lambda x: x[0])
     
-    # Verify success count against actual results
-    verified_success_count = sum(1 for r in results if r[1])
-    if verified_success_count != success_count:
-        print(f"Warning: Success count mismatch. Calculated: {verified_success_count}, Reported: {success_count}")
-        success_count = verified_success_count
-    
     return success_count, total_files
 
+# Converts the documents given as arguments (index, .docx path, .pdf path for
+# each) with the running Word, logging "success <index>" or
+# "error <index> <message>" to stderr after each one
+MACOS_BATCH_SCRIPT = '''
+on run argv
+    tell application "Microsoft Word"
+        repeat with i from 1 to (count of argv) by 3
+            set docIndex to item i of argv
+            try
+                set docPath to (POSIX file (item (i + 1) of argv)) as alias
+                set pdfPath to (POSIX file (item (i + 2) of argv)) as string
+                open docPath
+                set docName to name of active document
+                save as active document file format format PDF file name pdfPath
+                
+                # Safely close the document
+                try
+                    close active document saving no
+                on error closeErr
+                    try
+                        set docList to documents whose name is docName
+                        if (count of docList) > 0 then
+                            close document docName saving no
+                        end if
+                    on error
+                        # Close everything so documents don't accumulate
+                        try
+                            close all saving no
+                        end try
+                    end try
+                end try
+                
+                log "success " & docIndex
+            on error errMsg
+                try
+                    close active document saving no
+                on error
+                    # Close everything so documents don't accumulate
+                    try
+                        close all saving no
+                    end try
+                end try
+                log "error " & docIndex & " " & errMsg
+            end try
+        end repeat
+    end tell
+end run
+'''
+
+# Full path to osascript; CPython only starts a child with posix_spawn
+# instead of fork and exec when the executable is given with a directory
+OSASCRIPT = '/usr/bin/osascript'
+
+# Compiled copies of the conversion scripts, keyed by their source
+_compiled_scripts = {}
+_compiled_scripts_lock = threading.Lock()
+
+def osascript_command(script, compile_script=False):
+    """
+    Build the osascript command line for a script.
+    
+    With compile_script, the script is compiled to a .scpt file with
+    osacompile the first time it is seen, so later runs skip parsing and
+    compiling the source. Falls back to passing the source if that fails.
+    
+    Args:
+        script (str): AppleScript source
+        compile_script (bool, optional): Run a compiled copy of the script
+        
+    Returns:
+        list: osascript command line, without the script's arguments
+    """
+    if not compile_script:
+        return [OSASCRIPT, '-e', script]
+    
+    with _compiled_scripts_lock:
+        if script not in _compiled_scripts:
+            script_dir = tempfile.mkdtemp(prefix='docx_to_pdf_')
+            atexit.register(shutil.rmtree, script_dir, True)
+            compiled_path = os.path.join(script_dir, 'convert.scpt')
+            try:
+                process = subprocess.run(['/usr/bin/osacompile', '-o', compiled_path, '-e', script],
+                                         capture_output=True, close_fds=False)
+                compiled = process.returncode == 0
+            except OSError:
+                compiled = False
+            _compiled_scripts[script] = [OSASCRIPT, compiled_path] if compiled else [OSASCRIPT, '-e', script]
+        return _compiled_scripts[script]
+
+def run_osascript(script, *args, timeout=None):
+    """
+    Run an AppleScript with osascript and capture its output.
+    
+    close_fds is off so CPython can use posix_spawn, which is much cheaper
+    than forking the Python process on macOS. Pipes Python opens are not
+    inheritable, so the child still gets only its own stdio. Scripts given
+    arguments are the conversion scripts, which run once per document or
+    batch, so those are run from a compiled copy.
+    
+    Args:
+        script (str): AppleScript source
+        *args (str): Arguments for the script's run handler
+        timeout (float, optional): Seconds to wait before giving up
+        
+    Returns:
+        subprocess.CompletedProcess: Result with stdout and stderr as text
+    """
+    return subprocess.run(osascript_command(script, compile_script=bool(args)) + list(args),
+                          capture_output=True, text=True, close_fds=False, timeout=timeout)
+
+def wait_for_word_macos(timeout=30):
+    """
+    Wait until Word answers Apple events, instead of sleeping a fixed time.
+    
+    Returns as soon as Word reports its version, which is immediate when it
+    was already running.
+    
+    Args:
+        timeout (float, optional): Maximum number of seconds to wait
+        
+    Returns:
+        bool: True if Word responded before the timeout
+    """
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            process = run_osascript('tell application "Microsoft Word" to get version',
+                                    timeout=max(deadline - time.perf_counter(), 0.1))
+            if process.returncode == 0:
+                return True
+        except subprocess.TimeoutExpired:
+            break
+        time.sleep(0.05)
+    return False
+
 def convert_to_pdf_macos_batch(docx_files, pdf_dir, max_workers=4):
     """Convert multiple Word documents to PDF using a pool of persistent Word instances."""
     total_files = len(docx_files)
@@ -181,146 +627,91 @@ def convert_to_pdf_macos_batch(docx_files, pdf_dir, max_workers=4):
     
     def process_document_batch(file_batch):
         """Process a batch of documents using a single Word instance."""
-        thread_results = []
-        thread_success = 0
-        
-        import subprocess
-        
         try:
-            # Check if Word is already running in this thread
-            check_running_script = '''
-                tell application "System Events"
-                    set isRunning to exists (processes where name is "Microsoft Word")
-                end tell
-            '''
-            
-            process = subprocess.run(['osascript', '-e', check_running_script], capture_output=True, text=True)
-            was_running = process.stdout.strip() == "true"
-            
-            # Start Word for this batch
-            subprocess.run(['osascript', '-e', 'tell application "Microsoft Word" to activate'], capture_output=True)
-            time.sleep(2)  # Give Word time to start
+            # Convert every document in this batch with a single osascript
+            # process instead of starting one per document. Paths are passed as
+            # arguments (index, .docx path, .pdf path for each document) and the
+            # script logs a result line to stderr as each document finishes.
+            # Each PDF's state is noted first, so one left over from an
+            # earlier run isn't counted as converted.
+            documents = {}
+            previous_stats = {}
+            script_args = []
+            for index, docx_path, pdf_path, abs_docx_path, abs_pdf_path in file_batch:
+                documents[str(index)] = (index, docx_path, pdf_path)
+                previous_stats[index] = pdf_stat(abs_pdf_path)
+                script_args += [str(index), abs_docx_path, abs_pdf_path]
             
-            # Process all documents in this batch with one Word instance
-            for index, docx_path in file_batch:
-                start_time = time.time()
-                
-                # Convert paths to absolute POSIX paths for AppleScript
-                abs_docx_path = os.path.abspath(docx_path).replace('\\', '/')
-                pdf_path = os.path.join(pdf_dir, os.path.splitext(os.path.basename(docx_path))[0] + ".pdf")
-                abs_pdf_path = os.path.abspath(pdf_path).replace('\\', '/')
-                
-                # Process a single document without quitting Word
-                script = f'''
-                    tell application "Microsoft Word"
-                        try
-                            set docPath to POSIX file "{abs_docx_path}" as alias
-                            set pdfPath to POSIX file "{abs_pdf_path}" as string
-                            open docPath
-                            set docName to name of active document
-                            save as active document file format format PDF file name pdfPath
-                            
-                            # Safely close the document
-                            try
-                                close active document saving no
-                            on error closeErr
-                                try
-                                    set docList to documents whose name is docName
-                                    if (count of docList) > 0 then
-                                        close document docName saving no
-                                    end if
-                                on error
-                                    # Just continue, we'll clean up at the end
-                                end try
-                            end try
-                            
-                            return "success"
-                        on error errMsg
-                            try
-                                close active document saving no
-                            end try
-                            return "error: " & errMsg
-                        end try
-                    end tell
-                '''
-                
-                process = subprocess.run(['osascript', '-e', script], capture_output=True, text=True)
-                elapsed_time = time.time() - start_time
-                
-                # Check results
-                if os.path.exists(pdf_path):
+            def report(index, docx_path, pdf_path, status, error_msg, elapsed_time):
+                # A result line only counts as a success if the PDF was
+                # actually written during this batch
+                if status == 'success' and pdf_written(pdf_path, previous_stats[index]):
                     message = f"[{index}/{total_files}] Successfully converted {os.path.basename(docx_path)} in {elapsed_time:.1f} seconds"
-                    thread_success += 1
-                    thread_results.append((index, True, message))
-                    print(message)  # Print progress in real-time
+                    result_queue.put((index, True, message))
                 else:
-                    error_msg = process.stdout.strip()
-                    if not error_msg.startswith("error:"):
-                        error_msg = f"error: PDF not created - {error_msg}"
                     message = f"[{index}/{total_files}] Failed to convert {os.path.basename(docx_path)}: {error_msg} in {elapsed_time:.1f} seconds"
-                    thread_results.append((index, False, message))
-                    print(message)  # Print progress in real-time
+                    result_queue.put((index, False, message))
+            
+            process = subprocess.Popen(osascript_command(MACOS_BATCH_SCRIPT, compile_script=True) + script_args,
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                                       close_fds=False)
+            start_time = time.perf_counter()
+            for line in process.stderr:
+                status, _, rest = line.rstrip('\n').partition(' ')
+                doc_index, _, error_msg = rest.partition(' ')
+                if status not in ('success', 'error') or doc_index not in documents:
+                    continue  # Continuation of a multi-line error message
                 
-                # Try to clean up any open documents periodically to prevent accumulation
-                if index % 5 == 0:
-                    try:
-                        cleanup_script = '''
-                            tell application "Microsoft Word"
-                                if (count of documents) > 0 then
-                                    close all saving no
-                                end if
-                            end tell
-                        '''
-                        subprocess.run(['osascript', '-e', cleanup_script], capture_output=True)
-                    except:
-                        pass
+                index, docx_path, pdf_path = documents.pop(doc_index)
+                now = time.perf_counter()
+                if status == 'error':
+                    error_msg = f"error: {error_msg}"
+                else:
+                    error_msg = "error: PDF was not updated"
+                report(index, docx_path, pdf_path, status, error_msg, now - start_time)
+                start_time = now
+            process.wait()
             
-            # Quit Word only if it wasn't running before we started
-            if not was_running:
-                subprocess.run(['osascript', '-e', 'tell application "Microsoft Word" to quit'], capture_output=True)
+            # Documents the script never reached (e.g. Word could not be started)
+            for index, docx_path, pdf_path in documents.values():
+                report(index, docx_path, pdf_path, None, "error: PDF not created", time.perf_counter() - start_time)
         
         except Exception as e:
-            message = f"Error in batch processing: {str(e)}"
-            print(message)
-            thread_results.append((0, False, message))
-            
-            # Make sure Word is closed if there was an error
-            try:
-                subprocess.run(['osascript', '-e', 'tell application "Microsoft Word" to quit'], capture_output=True)
-            except:
-                pass
-        
-        return thread_results, thread_success
+            result_queue.put((0, False, f"Error in batch processing: {str(e)}"))
     
     try:
         print(f"Starting conversion with {max_workers} persistent Word instances...")
         
-        # Create indexed task list
-        indexed_files = [(i+1, docx_path) for i, docx_path in enumerate(docx_files)]
+        # Create indexed task list with each document's output path, plus
+        # the absolute paths handed to AppleScript
+        indexed_files = []
+        for i, docx_path in enumerate(docx_files):
+            pdf_path = _pdf_path_for(docx_path, pdf_dir)
+            indexed_files.append((i+1, docx_path, pdf_path, os.path.abspath(docx_path), os.path.abspath(pdf_path)))
         
         # Split files into batches for each worker thread
         batch_size = (len(docx_files) + max_workers - 1) // max_workers  # Ceiling division
         batches = [indexed_files[i:i+batch_size] for i in range(0, len(indexed_files), batch_size)]
         
-        # Process batches in parallel with ThreadPoolExecutor
+        # Start Word once for all the workers
+        run_osascript('tell application "Microsoft Word" to activate')
+        wait_for_word_macos()
+        
+        # Process batches in parallel with ThreadPoolExecutor. Threads are
+        # enough here: each one only waits on its osascript process, and all of
+        # them drive the same Word application either way.
+        # Results stream back through a bounded queue as documents finish.
+        result_queue = queue.Queue(maxsize=max_workers * 4)
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all batches and collect futures
-            future_to_batch = {executor.submit(process_document_batch, batch): i for i, batch in enumerate(batches)}
-            
-            # Process results as they complete
-            for future in as_completed(future_to_batch):
-                batch_results, batch_success = future.result()
-                results.extend(batch_results)
-                success_count += batch_success
+            futures = [executor.submit(process_document_batch, batch) for batch in batches]
+            results, success_count = _collect_results(result_queue, futures)
     
     except Exception as e:
         print(f"Error in parallel conversion: {str(e)}")
     
-    # Make sure all Word instances are closed
+    # Quit Word once every worker is done with it
     try:
-        import subprocess
-        subprocess.run(['osascript', '-e', 'tell application "Microsoft Word" to quit'], 
-                       capture_output=True, text=True)
+        run_osascript('tell application "Microsoft Word" to quit')
     except:
         pass
     
@@ -329,25 +720,50 @@ def convert_to_pdf_macos_batch(docx_files, pdf_dir, max_workers=4):
     
     return success_count, total_files
 
+# Word instance reused by every single-document conversion on a thread
+_word_local = threading.local()
+
+def get_word():
+    """
+    Return this thread's shared Word instance, starting it on first use.
+    
+    COM is initialized for the thread along with it, and both are kept for
+    the life of the process; the instance is quit when the interpreter exits.
+    
+    Returns:
+        Word Application COM object
+    """
+    word = getattr(_word_local, 'word', None)
+    if word is None:
+        import pythoncom  # Import pythoncom module for COM initialization
+        
+        pythoncom.CoInitialize()
+        word = dispatch_word()
+        original_options = {}
+        try:
+            configure_word(word, original_options)
+        except:
+            quit_word(word, original_options)
+            raise
+        _word_local.word = word
+        atexit.register(quit_word, word, original_options)
+    return word
+
 def convert_to_pdf_windows(docx_path, pdf_dir):
     """Convert Word document to PDF using Windows COM interface."""
-    import win32com.client
     import pywintypes
-    import pythoncom  # Import pythoncom module for COM initialization
-    
-    # Initialize COM for this thread
-    pythoncom.CoInitialize()
     
-    word = None
+    doc = None
     try:
-        word = win32com.client.Dispatch("Word.Application")
-        doc = word.Documents.Open(docx_path)
-        pdf_path = os.path.join(pdf_dir, os.path.splitext(os.path.basename(docx_path))[0] + ".pdf")
+        # Reuse one Word instance for every document instead of starting
+        # and quitting Word per file
+        word = get_word()
+        doc = open_document_windows(word, docx_path)
+        pdf_path = _pdf_path_for(docx_path, pdf_dir)
         
-        # PDF export options (17 is the PDF format code)
-        doc.SaveAs(pdf_path, FileFormat=17)
-        doc.Close()
-        word.Quit()
+        export_pdf_windows(doc, pdf_path)
+        doc.Close(SaveChanges=False)
+        doc = None
         
         return True, f"Successfully converted {os.path.basename(docx_path)}"
     except pywintypes.com_error as e:
@@ -355,45 +771,53 @@ def convert_to_pdf_windows(docx_path, pdf_dir):
     except Exception as e:
         return False, f"Error converting {os.path.basename(docx_path)}: {str(e)}"
     finally:
-        try:
-            if 'doc' in locals() and doc:
-                doc.Close(False)
-            if word:
-                word.Quit()
-        except:
-            pass
-        
-        # Uninitialize COM for this thread
-        pythoncom.CoUninitialize()
+        # Close a document left open by a failed export; Word itself stays up
+        if doc is not None:
+            try:
+                doc.Close(SaveChanges=False)
+            except:
+                pass
+
+# Converts the .docx file given as the first argument to the PDF path given
+# as the second, without using macros
+MACOS_CONVERT_SCRIPT = '''
+on run argv
+    tell application "Microsoft Word"
+        set docPath to (POSIX file (item 1 of argv)) as alias
+        set pdfPath to (POSIX file (item 2 of argv)) as string
+        open docPath
+        set theDoc to active document
+        save as theDoc file format format PDF file name pdfPath
+        close theDoc saving no
+    end tell
+end run
+'''
+
+# Whether convert_to_pdf_macos has arranged for Word to quit at exit
+_macos_quit_registered = False
 
 def convert_to_pdf_macos(docx_path, pdf_dir):
     """Convert Word document to PDF using AppleScript."""
     try:
-        # Convert paths to absolute POSIX paths for AppleScript
-        docx_path = os.path.abspath(docx_path).replace('\\', '/')
-        pdf_path = os.path.join(pdf_dir, os.path.splitext(os.path.basename(docx_path))[0] + ".pdf")
-        pdf_path = os.path.abspath(pdf_path).replace('\\', '/')
-        
-        # AppleScript to convert document without using macros
-        script = f'''
-            tell application "Microsoft Word"
-                set docPath to POSIX file "{docx_path}" as alias
-                set pdfPath to POSIX file "{pdf_path}" as string
-                open docPath
-                set theDoc to active document
-                save as theDoc file format format PDF file name pdfPath
-                close theDoc saving no
-                quit
-            end tell
-        '''
+        # AppleScript needs absolute paths
+        docx_path = os.path.abspath(docx_path)
+        pdf_path = os.path.abspath(_pdf_path_for(docx_path, pdf_dir))
+        
+        # Leave Word running for the next document and quit it once at exit
+        global _macos_quit_registered
+        if not _macos_quit_registered:
+            atexit.register(run_osascript, 'tell application "Microsoft Word" to quit')
+            _macos_quit_registered = True
         
-        import subprocess
-        process = subprocess.run(['osascript', '-e', script], capture_output=True, text=True)
+        # Paths are passed as arguments so quotes or backslashes in file
+        # names can't break out of the script
+        previous_stat = pdf_stat(pdf_path)
+        process = run_osascript(MACOS_CONVERT_SCRIPT, docx_path, pdf_path)
         
         if process.returncode != 0:
             return False, f"Error converting {os.path.basename(docx_path)}: {process.stderr}"
         
-        if not os.path.exists(pdf_path):
+        if not pdf_written(pdf_path, previous_stat):
             return False, f"PDF file was not created for {os.path.basename(docx_path)}"
             
         return True, f"Successfully converted {os.path.basename(docx_path)}"
@@ -411,19 +835,120 @@ def convert_to_pdf(docx_path, pdf_dir):
     Returns:
         tuple: (success, message) where success is a boolean and message is a string
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
-    if platform.system() == 'Windows':
+    if SYSTEM == 'Windows':
         success, message = convert_to_pdf_windows(docx_path, pdf_dir)
-    elif platform.system() == 'Darwin':  # macOS
+    elif SYSTEM == 'Darwin':  # macOS
         success, message = convert_to_pdf_macos(docx_path, pdf_dir)
     else:
         return False, "Unsupported operating system"
     
-    elapsed_time = time.time() - start_time
+    elapsed_time = time.perf_counter() - start_time
     return success, f"{message} in {elapsed_time:.1f} seconds"
 
-def create_pdfs(input_dir, pdf_dir=None, max_workers=1):
+def _list_pdfs(pdf_dir):
+    """
+    List the PDF files in a directory with one directory read.
+    
+    Args:
+        pdf_dir (str): Directory for the PDF files
+        
+    Returns:
+        dict: Modification time of each PDF, keyed by file name
+    """
+    pdfs = {}
+    with os.scandir(pdf_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.pdf') and entry.is_file():
+                pdfs[entry.name] = entry.stat().st_mtime
+    return pdfs
+
+def _needs_conversion(docx_entry, existing_pdfs):
+    """
+    Check whether a document still needs converting.
+    
+    Args:
+        docx_entry (os.DirEntry): Directory entry of the Word document
+        existing_pdfs (dict): PDF modification times keyed by name, from _list_pdfs
+        
+    Returns:
+        bool: False if its PDF already exists and is at least as new as the document
+    """
+    pdf_mtime = existing_pdfs.get(os.path.splitext(docx_entry.name)[0] + ".pdf")
+    return pdf_mtime is None or pdf_mtime < docx_entry.stat().st_mtime
+
+def word_available():
+    """Check whether Word automation can be used on this system."""
+    return dependencies_ok and SYSTEM in ['Windows', 'Darwin']
+
+def requires_word(docx_path):
+    """
+    Check whether a document needs Word rather than LibreOffice to convert.
+    
+    Looks for embedded OLE objects (e.g. Excel charts or Visio drawings) in
+    the package's content types, which LibreOffice can't render faithfully.
+    
+    Args:
+        docx_path (str): Path to the Word document
+        
+    Returns:
+        bool: True if the document contains embedded OLE objects
+    """
+    try:
+        with zipfile.ZipFile(docx_path) as docx:
+            return b'oleObject' in docx.read('[Content_Types].xml')
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return False
+
+def convert_with_word(docx_files, pdf_dir, max_workers):
+    """
+    Convert Word documents to PDF with Word, one document at a time if the batch fails.
+    
+    Args:
+        docx_files (list): Paths to the Word documents
+        pdf_dir (str): Directory for the PDF files
+        max_workers (int): Number of parallel Word instances to use
+        
+    Returns:
+        int: Number of documents converted
+    """
+    total_files = len(docx_files)
+    
+    # Display appropriate message based on thread count
+    if max_workers == 1:
+        worker_message = "a single Word instance for all documents"
+    else:
+        worker_message = f"{max_workers} persistent Word instances, each handling multiple documents"
+    
+    # Use the specified number of threads (default is 1)
+    try:
+        if SYSTEM == 'Windows':
+            print(f"\nUsing {worker_message}...")
+            success_count, _ = convert_to_pdf_windows_batch(docx_files, pdf_dir, max_workers)
+        elif SYSTEM == 'Darwin':  # macOS
+            print(f"\nUsing {worker_message}...")
+            success_count, _ = convert_to_pdf_macos_batch(docx_files, pdf_dir, max_workers)
+        else:
+            raise ValueError("Unsupported operating system")
+    except Exception as e:
+        print(f"Error in batch conversion: {str(e)}")
+        print("Attempting to convert files individually as fallback...")
+        
+        # Fallback to individual conversion if batch fails
+        success_count = 0
+        for i, docx_path in enumerate(docx_files):
+            try:
+                success, message = convert_to_pdf(docx_path, pdf_dir)
+                if success:
+                    success_count += 1
+                print(f"[{i+1}/{total_files}] {message}")
+            except Exception as e:
+                print(f"[{i+1}/{total_files}] Error: {str(e)}")
+    
+    return success_count
+
+def create_pdfs(input_dir, pdf_dir=None, max_workers=1, force=False, engine='word'):
     """
     Convert all Word (.docx) files in a directory to PDF format.
     
@@ -432,12 +957,17 @@ def create_pdfs(input_dir, pdf_dir=None, max_workers=1):
         pdf_dir (str, optional): Directory for PDF output. If None, creates 'pdf_exports' subdirectory
         max_workers (int, optional): Maximum number of parallel Word instances to use.
                                   Default is 1, which is recommended for optimal performance.
+        force (bool, optional): Convert every document, even those whose PDF is already up to date
+        engine (str, optional): 'word' to convert with Microsoft Word (default), or
+                                'libreoffice' to use headless LibreOffice (documents with
+                                embedded objects still go to Word when it is available)
         
     Returns:
         tuple: (success_count, total_files) indicating number of successfully converted files
     """
     success_count = 0
     total_files = 0
+    skipped = 0
     
     try:
         # Verify directory exists
@@ -451,72 +981,76 @@ def create_pdfs(input_dir, pdf_dir=None, max_workers=1):
         pdf_dir = os.path.abspath(pdf_dir)
         os.makedirs(pdf_dir, exist_ok=True)
         
-        # Find all .docx files in the directory
-        docx_files = [os.path.join(input_dir, f) for f in os.listdir(input_dir) 
-                     if f.endswith('.docx') and os.path.isfile(os.path.join(input_dir, f))]
+        # Find all .docx files in the directory, skipping those whose PDF is
+        # already up to date unless forced
+        existing_pdfs = {} if force else _list_pdfs(pdf_dir)
+        docx_files = []
+        with os.scandir(input_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.docx') or not entry.is_file():
+                    continue
+                if not force and not _needs_conversion(entry, existing_pdfs):
+                    skipped += 1
+                    continue
+                docx_files.append(entry.path)
         
         total_files = len(docx_files)
         if not docx_files:
-            print("No .docx files found in the specified directory.")
+            if skipped:
+                print(f"All {skipped} .docx files already have up-to-date PDFs (use --force to convert them again).")
+            else:
+                print("No .docx files found in the specified directory.")
             return 0, 0
         
         print(f"\nFound {total_files} .docx files to process")
+        if skipped:
+            print(f"Skipped {skipped} .docx files whose PDFs are already up to date")
         print(f"Output directory: {os.path.abspath(pdf_dir)}")
         
-        # Ensure max_workers is at least 1
+        # Ensure max_workers is at least 1, and no more than there are files,
+        # CPU cores or MAX_WORKERS; extra Word instances only compete for CPU
+        # and disk
+        requested_workers = max_workers
         if max_workers is None or max_workers < 1:
             max_workers = 1
-            
-        # Display appropriate message based on thread count
-        if max_workers == 1:
-            worker_message = "a single Word instance for all documents"
-        else:
-            worker_message = f"{max_workers} persistent Word instances, each handling multiple documents"
+        max_workers = max(1, min(max_workers, total_files, os.cpu_count() or 2, MAX_WORKERS))
+        if requested_workers is not None and max_workers < requested_workers:
+            print(f"Using {max_workers} of the {requested_workers} requested workers")
         
         # Track overall start time
-        overall_start = time.time()
+        overall_start = time.perf_counter()
         
-        # Use the specified number of threads (default is 1)
-        try:
-            if platform.system() == 'Windows':
-                print(f"\nUsing {worker_message}...")
-                success_count, _ = convert_to_pdf_windows_batch(docx_files, pdf_dir, max_workers)
-            elif platform.system() == 'Darwin':  # macOS
-                print(f"\nUsing {worker_message}...")
-                success_count, _ = convert_to_pdf_macos_batch(docx_files, pdf_dir, max_workers)
-            else:
-                raise ValueError("Unsupported operating system")
-        except Exception as e:
-            print(f"Error in batch conversion: {str(e)}")
-            print("Attempting to convert files individually as fallback...")
+        word_files = docx_files
+        libreoffice_files = []
+        libreoffice_success = 0
+        success_count = 0
+        if engine == 'libreoffice':
+            # Documents with embedded OLE objects only render properly in
+            # Word, so those still go to Word when it can be used
+            use_word = word_available()
+            word_files = []
+            for docx_path in docx_files:
+                if use_word and requires_word(docx_path):
+                    word_files.append(docx_path)
+                else:
+                    libreoffice_files.append(docx_path)
             
-            # Fallback to individual conversion if batch fails
-            success_count = 0
-            for i, docx_path in enumerate(docx_files):
-                try:
-                    success, message = convert_to_pdf(docx_path, pdf_dir)
-                    if success:
-                        success_count += 1
-                    print(f"[{i+1}/{total_files}] {message}")
-                except Exception as e:
-                    print(f"[{i+1}/{total_files}] Error: {str(e)}")
-        
-        # Verify success count by counting actual PDF files
-        created_pdfs = []
-        for docx_path in docx_files:
-            pdf_name = os.path.splitext(os.path.basename(docx_path))[0] + ".pdf"
-            pdf_path = os.path.join(pdf_dir, pdf_name)
-            if os.path.exists(pdf_path):
-                created_pdfs.append(pdf_path)
-        
-        actual_pdf_count = len(created_pdfs)
-        if actual_pdf_count != success_count:
-            print(f"Warning: Success count ({success_count}) doesn't match actual PDF files found ({actual_pdf_count})")
-            print("Using actual count of PDF files created for reporting.")
-            success_count = actual_pdf_count
+            # LibreOffice converts each worker's whole share of the files in
+            # a single headless run, so there is no per-document fallback.
+            # Its count only includes PDFs written during this run, the same
+            # as Word's, so the two can be added up.
+            if libreoffice_files:
+                print(f"\nUsing LibreOffice with {max_workers} parallel instance(s)...")
+                libreoffice_success, _ = convert_docx_to_pdf(libreoffice_files, pdf_dir, max_workers)
+                success_count = libreoffice_success
+            if word_files:
+                print(f"\n{len(word_files)} documents contain embedded objects and will be converted with Word")
+        
+        if word_files:
+            success_count += convert_with_word(word_files, pdf_dir, max_workers)
         
         # Calculate overall time
-        overall_time = time.time() - overall_start
+        overall_time = time.perf_counter() - overall_start
         
         # Print summary
         print("\nProcessing Summary:")
@@ -524,6 +1058,11 @@ def create_pdfs(input_dir, pdf_dir=None, max_workers=1):
         if total_files > 0:
             print(f"Average time per document: {overall_time/total_files:.1f} seconds")
         print(f"PDF files created: {success_count}/{total_files}")
+        if libreoffice_files and word_files:
+            print(f"  With LibreOffice: {libreoffice_success}/{len(libreoffice_files)}")
+            print(f"  With Word: {success_count - libreoffice_success}/{len(word_files)}")
+        if skipped:
+            print(f"Skipped (already up to date): {skipped}")
         print(f"Output directory: {os.path.abspath(pdf_dir)}")
         
         return success_count, total_files
@@ -536,39 +1075,49 @@ def create_pdfs(input_dir, pdf_dir=None, max_workers=1):
 
 def main():
     """Main function to handle command line arguments."""
-    if len(sys.argv) < 2 or len(sys.argv) > 3:
-        print("Usage: python docx_to_pdf.py <directory_path> [max_threads]")
-        sys.exit(1)
+    args = sys.argv[1:]
+    force = '--force' in args
+    if force:
+        args.remove('--force')
     
-    # Check if dependencies are installed
-    if not dependencies_ok:
-        print("\nCannot continue: Required dependencies are missing.")
+    engine = None
+    for arg in args[:]:
+        if arg.startswith('--engine='):
+            engine = arg.split('=', 1)[1].lower()
+            args.remove(arg)
+    
+    if len(args) < 1 or len(args) > 2 or engine not in (None, 'word', 'libreoffice'):
+        print("Usage: python docx_to_pdf.py <directory_path> [max_threads] [--force] [--engine=word|libreoffice]")
         sys.exit(1)
     
-    # Check if running on supported OS
-    if platform.system() not in ['Windows', 'Darwin']:
-        print("Error: This script only supports Windows and macOS")
+    # Default to Word, or to LibreOffice where Word can't be used
+    if engine is None:
+        engine = 'word' if word_available() or not libreoffice_available() else 'libreoffice'
+    
+    # Check that the chosen engine's dependencies are installed
+    if not check_dependencies(engine):
+        print("\nCannot continue: Required dependencies are missing.")
         sys.exit(1)
     
     # Parse arguments
-    input_dir = sys.argv[1]
+    input_dir = args[0]
     max_threads = 1  # Default to 1 thread
     
-    if len(sys.argv) == 3:
+    if len(args) == 2:
         try:
-            max_threads = int(sys.argv[2])
+            max_threads = int(args[1])
             if max_threads < 1:
                 print(f"Warning: Invalid max_threads value '{max_threads}'. Must be at least 1. Using 1 thread.")
                 max_threads = 1
         except ValueError:
-            print(f"Warning: Invalid max_threads value '{sys.argv[2]}'. Must be an integer. Using 1 thread.")
+            print(f"Warning: Invalid max_threads value '{args[1]}'. Must be an integer. Using 1 thread.")
     
     if max_threads == 1:
         print("Using single-threaded mode (recommended for optimal performance)")
     else:
         print(f"Using {max_threads} threads for conversion (single-threaded mode is usually faster)")
     
-    create_pdfs(input_dir, max_workers=max_threads)
+    create_pdfs(input_dir, max_workers=max_threads, force=force, engine=engine)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
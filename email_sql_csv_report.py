@@ -11,7 +11,6 @@ Requirements:
     - Python 3.6+
     - Required packages:
         - sqlite3 (built-in) or another DB driver depending on your database
-        - pandas (for easy data handling and CSV export)
         - smtplib (built-in for sending emails)
         - email (built-in for crafting email messages)
         - For MS SQL Server: pyodbc
@@ -46,6 +45,8 @@ db_type = sqlite  # sqlite, oracle, mssql
 # Query settings
 query_file = query.sql  # File containing the SQL query
 csv_output_dir = path/to/directory  # Where to save the CSV file
+chunksize = 10000  # Optional: fetch and write this many rows at a time (default 10000)
+gzip_output = false  # Optional: gzip the CSV (.csv.gz) to shrink the attachment
 
 # Email settings
 smtp_server = smtp.gmail.com
@@ -65,13 +66,11 @@ import os
 import smtplib
 import traceback
 from datetime import datetime
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
+from email.message import EmailMessage
 import logging
 
 # Import utility functions
-from utils import connect_to_database, run_query, export_to_csv, read_config
+from utils import connect_to_database, stream_query_to_csv, read_config
 
 # Ensure logs directory exists
 os.makedirs('logs', exist_ok=True)
@@ -87,15 +86,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def send_email(config, attachment_file):
+def connect_smtp(config):
     """
-    Send an email with the CSV file attached.
+    Open a new SMTP connection, starting TLS and logging in as configured.
     
     Args:
         config: Configuration dictionary
-        attachment_file: Path to the CSV file to attach
+        
+    Returns:
+        smtplib.SMTP: Connected SMTP client
     """
-    # Email server settings
     smtp_server = config.get('smtp_server', '')
     smtp_port = int(config.get('smtp_port', 25))
     use_tls = config.get('use_tls', '').lower() == 'true'
@@ -103,6 +103,28 @@ def send_email(config, attachment_file):
     smtp_username = config.get('smtp_username', '')
     smtp_password = config.get('smtp_password', '')
     
+    logger.info(f"Connecting to SMTP server {smtp_server}:{smtp_port}")
+    server = smtplib.SMTP(smtp_server, smtp_port)
+    server.set_debuglevel(0)
+    
+    if use_tls:
+        logger.info("Starting TLS connection")
+        server.starttls()
+        
+    if use_auth:
+        logger.info(f"Logging in as {smtp_username}")
+        server.login(smtp_username, smtp_password)
+        
+    return server
+
+def send_email(config, attachment_file):
+    """
+    Send an email with the CSV file attached.
+    
+    Args:
+        config: Configuration dictionary
+        attachment_file: Path to the CSV (or gzipped .csv.gz) file to attach
+    """
     # Email content
     from_email = config.get('from_email', '')
     recipients_str = config.get('recipients', '')
@@ -116,38 +138,38 @@ def send_email(config, attachment_file):
     
     try:
         # Create message
-        msg = MIMEMultipart()
+        msg = EmailMessage()
         msg['From'] = from_email
         msg['To'] = ', '.join(recipients)
         msg['Subject'] = subject
+        msg.set_content(body)
         
-        # Attach body text
-        msg.attach(MIMEText(body, 'plain'))
-        
-        # Attach CSV file
+        # Attach CSV file, which may be gzipped. The raw bytes are
+        # base64-encoded into the message straight away and not kept.
+        if attachment_file.endswith('.gz'):
+            maintype, subtype = 'application', 'gzip'
+        else:
+            maintype, subtype = 'text', 'csv'
         with open(attachment_file, 'rb') as file:
-            part = MIMEApplication(file.read(), Name=os.path.basename(attachment_file))
-        
-        # Add header
-        part['Content-Disposition'] = f'attachment; filename="{os.path.basename(attachment_file)}"'
-        msg.attach(part)
+            data = file.read()
+        attachment_size = len(data)
+        msg.add_attachment(data, maintype=maintype, subtype=subtype,
+                           filename=os.path.basename(attachment_file))
+        del data
         
         # Connect to SMTP server and send email
-        logger.info(f"Connecting to SMTP server {smtp_server}:{smtp_port}")
-        server = smtplib.SMTP(smtp_server, smtp_port)
-        server.set_debuglevel(0)
-        
-        if use_tls:
-            logger.info("Starting TLS connection")
-            server.starttls()
-            
-        if use_auth:
-            logger.info(f"Logging in as {smtp_username}")
-            server.login(smtp_username, smtp_password)
+        server = connect_smtp(config)
+        try:
+            check_message_size(server, attachment_size)
             
-        logger.info(f"Sending email to {len(recipients)} recipients")
-        server.sendmail(from_email, recipients, msg.as_string())
-        server.quit()
+            # send_message flattens the message straight to bytes, without an
+            # intermediate str copy, and sends every recipient in one
+            # transaction. It also declares the message SIZE to servers that
+            # support it, so an oversize message is refused before upload.
+            logger.info(f"Sending email to {len(recipients)} recipients")
+            server.send_message(msg, from_email, recipients)
+        finally:
+            server.quit()
         
         logger.info("Email sent successfully")
         
@@ -155,6 +177,32 @@ def send_email(config, attachment_file):
         logger.error(f"Error sending email: {str(e)}")
         raise
 
+def check_message_size(server, attachment_size):
+    """
+    Fail early if the attachment is over the server's advertised size limit.
+    
+    Uses the base64-encoded attachment size as an estimate, so an oversize
+    report is caught without flattening the message.
+    
+    Args:
+        server: Connected smtplib.SMTP client
+        attachment_size (int): Size of the attachment in bytes
+        
+    Raises:
+        ValueError: If the encoded attachment exceeds the server's SIZE limit
+    """
+    server.ehlo_or_helo_if_needed()
+    max_size = server.esmtp_features.get('size', '').strip()
+    if not max_size.isdigit() or int(max_size) == 0:
+        # No limit advertised
+        return
+        
+    # base64 encoding grows the attachment by a third
+    encoded_size = (attachment_size + 2) // 3 * 4
+    if encoded_size > int(max_size):
+        raise ValueError(f"The attachment is about {encoded_size} bytes once encoded, over the "
+                         f"SMTP server's {max_size} byte limit. Set gzip_output = true to compress it.")
+
 def validate_config(config):
     """
     Validate the configuration and check required fields.
@@ -218,23 +266,20 @@ def main():
         connection = connect_to_database(config, logger)
         
         try:
-            # Run query
-            logger.info("Executing SQL query")
-            df = run_query(connection, query, logger)
-            
             # Update the configuration to use a directory for CSV output
             csv_output_dir = config.get('csv_output_dir', '.')
 
-            # Ensure the CSV output directory exists
-            os.makedirs(csv_output_dir, exist_ok=True)
-
-            # Generate a timestamped filename
+            # Generate a timestamped filename. stream_query_to_csv creates
+            # the output directory if it doesn't exist.
             csv_filename = f"query_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             csv_output = os.path.join(csv_output_dir, csv_filename)
 
-            # Export to CSV
-            logger.info(f"Exporting results to {csv_output}")
-            csv_file = export_to_csv(df, csv_output, logger)
+            # Run query and stream the rows straight to CSV
+            logger.info(f"Executing SQL query and streaming results to {csv_output}")
+            chunk_size = int(config.get('chunksize', 10000))
+            compress = config.get('gzip_output', '').lower() == 'true'
+            csv_file = stream_query_to_csv(connection, query, csv_output, logger,
+                                           chunk_size=chunk_size, compress=compress)
             
             # Send email with attachment
             logger.info("Sending email with CSV attachment")
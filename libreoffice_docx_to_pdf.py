@@ -33,6 +33,41 @@ import shutil
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+def pdf_stat(pdf_path):
+    """
+    Get what identifies the current version of a PDF, if it exists.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        
+    Returns:
+        tuple: (st_mtime_ns, st_size), or None if the file doesn't exist
+    """
+    try:
+        stat = os.stat(pdf_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def pdf_written(pdf_path, previous_stat):
+    """
+    Check that a PDF was written since pdf_stat was taken before converting.
+    
+    Compares the file with its own earlier state rather than with the local
+    clock, which can differ from a file server's. An older PDF of the same
+    name left over from a previous run does not count, so a failed
+    conversion isn't mistaken for a successful one.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        previous_stat (tuple): pdf_stat result from before the conversion
+        
+    Returns:
+        bool: True if the PDF is new or has changed
+    """
+    current_stat = pdf_stat(pdf_path)
+    return current_stat is not None and current_stat != previous_stat
+
 def is_libreoffice_installed():
     """
     Simple check if LibreOffice is installed and available on the system.
@@ -141,6 +176,12 @@ def convert_batch_with_libreoffice(batch_info):
         
         print(f"Batch {batch_number}: Starting conversion of {len(batch_files)} files...")
         
+        # Note each PDF's current state, so one left over from an earlier
+        # run isn't counted as converted
+        pdf_paths = {index: os.path.join(pdf_dir, os.path.splitext(os.path.basename(docx_path))[0] + ".pdf")
+                     for index, docx_path in batch_files}
+        previous_stats = {index: pdf_stat(pdf_path) for index, pdf_path in pdf_paths.items()}
+        
         # Run the conversion
         process = subprocess.run(cmd, capture_output=True, text=True)
         
@@ -148,10 +189,7 @@ def convert_batch_with_libreoffice(batch_info):
         
         # Check results for each file
         for index, docx_path in batch_files:
-            pdf_filename = os.path.splitext(os.path.basename(docx_path))[0] + ".pdf"
-            pdf_path = os.path.join(pdf_dir, pdf_filename)
-            
-            if os.path.exists(pdf_path):
+            if pdf_written(pdf_paths[index], previous_stats[index]):
                 success_count += 1
                 message = f"[{index}/{total_files}] Successfully converted {os.path.basename(docx_path)}"
                 batch_results.append((index, True, message))
@@ -178,7 +216,7 @@ def convert_batch_with_libreoffice(batch_info):
     
     return batch_results, success_count
 
-def convert_docx_to_pdf(docx_files, pdf_dir, max_workers=None):
+def convert_docx_to_pdf(docx_files, pdf_dir, max_workers=None, kill_stray_processes=False):
     """
     Convert multiple DOCX files to PDF using LibreOffice in parallel.
     
@@ -186,6 +224,9 @@ def convert_docx_to_pdf(docx_files, pdf_dir, max_workers=None):
         docx_files: List of DOCX file paths
         pdf_dir: Output directory for PDF files
         max_workers: Number of parallel LibreOffice instances to use
+        kill_stray_processes: Kill every LibreOffice process on the machine
+            afterwards, including ones the user has open. Off by default;
+            each batch's own process has already exited by then.
         
     Returns:
         Tuple of (success_count, total_files)
@@ -239,16 +280,17 @@ def convert_docx_to_pdf(docx_files, pdf_dir, max_workers=None):
     except Exception as e:
         print(f"Error in conversion process: {str(e)}")
     
-    # Make sure to kill any rogue LibreOffice processes
-    try:
-        if platform.system() == 'Windows':
-            subprocess.run(["taskkill", "/F", "/IM", "soffice.exe", "/T"], 
-                         capture_output=True)
-        else:
-            subprocess.run(["pkill", "soffice.bin"], capture_output=True)
-            subprocess.run(["pkill", "libreoffice"], capture_output=True)
-    except:
-        pass
+    # Make sure to kill any rogue LibreOffice processes, if asked to
+    if kill_stray_processes:
+        try:
+            if platform.system() == 'Windows':
+                subprocess.run(["taskkill", "/F", "/IM", "soffice.exe", "/T"], 
+                             capture_output=True)
+            else:
+                subprocess.run(["pkill", "soffice.bin"], capture_output=True)
+                subprocess.run(["pkill", "libreoffice"], capture_output=True)
+        except:
+            pass
     
     # Sort results by index for consistent output
     results.sort(key=lambda x: x[0])
@@ -300,7 +342,8 @@ def create_pdfs(input_dir, pdf_dir=None, max_workers=None):
         overall_start = time.time()
         
         # Convert files using LibreOffice
-        success_count, total_files = convert_docx_to_pdf(docx_files, pdf_dir, max_workers)
+        success_count, total_files = convert_docx_to_pdf(docx_files, pdf_dir, max_workers,
+                                                         kill_stray_processes=True)
         
         # Calculate overall time
         overall_time = time.time() - overall_start
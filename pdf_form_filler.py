@@ -407,18 +407,21 @@ def main():
         # Create output directory if it doesn't exist
         os.makedirs(output_directory, exist_ok=True)
         
-        # Read Excel data
-        wb = load_workbook(filename=excel_file, data_only=True)
+        # Read Excel data. Read-only mode streams the sheet instead of building
+        # the full cell model, which is much faster on large workbooks.
+        wb = load_workbook(filename=excel_file, data_only=True, read_only=True)
         ws = wb.active
-        headers = [cell.value for cell in ws[1]]
+        headers = list(next(ws.iter_rows(max_row=1, values_only=True), ()))
+        # Set of header names for the membership checks below
+        headers_set = set(h for h in headers if h is not None)
         
         # Verify filename fields exist in headers if specified
         if filename_field1:
-            if filename_field1 not in headers:
+            if filename_field1 not in headers_set:
                 raise ValueError(f"Specified filename field '{filename_field1}' not found in Excel headers")
             
         if filename_field2:
-            if filename_field2 not in headers:
+            if filename_field2 not in headers_set:
                 raise ValueError(f"Specified filename field '{filename_field2}' not found in Excel headers")
         
         if not filename_field1 and not filename_field2:
@@ -428,14 +431,18 @@ def main():
         
         # Collect all rows to process (non-empty rows)
         rows_to_process = []
-        for idx, row_cells in enumerate(ws.iter_rows(min_row=2)):
-            if not any(cell.value for cell in row_cells):  # Skip empty rows
+        for idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True)):
+            if not any(row):  # Skip empty rows
                 continue
                 
             # Create data dictionary
-            data = {headers[i]: cell.value for i, cell in enumerate(row_cells) if i < len(headers)}
+            # (read-only rows may omit trailing empty cells, so index by header)
+            data = {header: row[i] if i < len(row) else None for i, header in enumerate(headers)}
             rows_to_process.append((idx, data))
         
+        # Read-only workbooks keep the file open until closed
+        wb.close()
+        
         total_files = len(rows_to_process)
         print(f"Found {total_files} non-empty rows to process")
         
@@ -36,6 +36,7 @@ Note:
     - No automatic normalization of field names is performed
     - Output files will be named using the specified fields (or timestamp if omitted)
     - The script preserves all PDF formatting, images, and other content
+    - Set the PDF_TEMPLATE_DEBUG environment variable to 1 to print stack traces for row errors
 """
 
 import sys
@@ -46,7 +47,13 @@ import time
 from openpyxl import load_workbook
 import traceback
 import fitz  # PyMuPDF
-from utils import format_date, sanitize_filename, read_config, get_unique_filename  # Import shared utilities
+from utils import format_date, sanitize_filename, read_config, get_unique_filename, list_filenames  # Import shared utilities
+
+# Print full stack traces for row errors (set PDF_TEMPLATE_DEBUG=1)
+DEBUG = os.environ.get('PDF_TEMPLATE_DEBUG', '0') not in ('', '0')
+
+# Pattern matching a bracketed field such as [First Name]
+FIELD_PATTERN = re.compile(r'\[([^\]]+)\]')
 
 def find_fields_in_pdf(pdf_path):
     """
@@ -59,18 +66,14 @@ def find_fields_in_pdf(pdf_path):
         set: Set of unique field names found (without brackets)
     """
     fields = set()
-    pattern = r'\[([^\]]+)\]'
     
     try:
         # Open PDF
         with fitz.open(pdf_path) as doc:
             # Search each page
             for page in doc:
-                # Get text from page
-                text = page.get_text()
-                # Find all matches
-                matches = re.finditer(pattern, text)
-                fields.update(match.group(1) for match in matches)
+                # Get text from page and collect the text inside each field's brackets
+                fields.update(FIELD_PATTERN.findall(page.get_text()))
     
     except Exception as e:
         print(f"Error reading PDF: {e}")
@@ -253,61 +256,69 @@ def main():
         print(f"\nFound {len(template_fields)} unique fields in PDF template:")
         print(", ".join(sorted(template_fields)))
         
-        # Read Excel data
-        wb = load_workbook(filename=excel_file, data_only=True)
+        # Read Excel data. Read-only mode streams the sheet instead of building
+        # the full cell model, which is much faster on large workbooks.
+        wb = load_workbook(filename=excel_file, data_only=True, read_only=True)
         ws = wb.active
-        headers = [cell.value for cell in ws[1]]
+        headers = list(next(ws.iter_rows(max_row=1, values_only=True), ()))
+        # Set of header names for the membership checks below
+        headers_set = set(h for h in headers if h is not None)
         
         # Verify all template fields exist in Excel headers - do this once before processing rows
         missing_fields = []
         for field in template_fields:
-            if field not in headers:
+            if field not in headers_set:
                 missing_fields.append(field)
         
         if missing_fields:
             raise ValueError(f"Fields in PDF template not found in Excel headers: {', '.join(missing_fields)}")
         
         # Verify filename fields exist in headers if specified - do this once before processing rows
-        if filename_field1 and filename_field1 not in headers:
+        if filename_field1 and filename_field1 not in headers_set:
             raise ValueError(f"Specified filename field '{filename_field1}' not found in Excel headers")
         
-        if filename_field2 and filename_field2 not in headers:
+        if filename_field2 and filename_field2 not in headers_set:
             raise ValueError(f"Specified filename field '{filename_field2}' not found in Excel headers")
         
         if not filename_field1 and not filename_field2:
             print("No filename fields specified - using timestamps for output files")
         
-        # Count total non-empty rows
-        total_files = sum(1 for row in ws.iter_rows(min_row=2) if any(cell.value for cell in row))
+        # Collect the non-empty rows in a single pass over the sheet, which
+        # also gives the total for progress messages
+        rows = [row for row in ws.iter_rows(min_row=2, values_only=True) if any(row)]
+        total_files = len(rows)
+        
+        # Read-only workbooks keep the file open until closed
+        wb.close()
+        
         processed_count = 0
         success_count = 0
         
+        # Names of the files already in the output directory, plus those used
+        # by earlier rows, so duplicates are found without a filesystem check per name
+        reserved_names = list_filenames(output_directory)
+        
         # Process each row
-        for row_cells in ws.iter_rows(min_row=2):
-            row = [cell.value for cell in row_cells]
-            if not any(row):  # Skip empty rows
-                continue
-            
+        for row in rows:
             processed_count += 1
             start_time = time.time()
             
             try:
                 # Create data dictionary with formatted dates
+                # (read-only rows may omit trailing empty cells, so index by header)
                 data = {}
-                for i, cell in enumerate(row_cells):
-                    if i < len(headers):
-                        header = headers[i]
-                        value = cell.value
+                for i, header in enumerate(headers):
+                    value = row[i] if i < len(row) else None
+                    
+                    # Format dates consistently
+                    if isinstance(value, (dt.datetime, dt.date)):
+                        value = format_date(value)
+                    elif value is not None:
+                        value = str(value)
+                    else:
+                        value = ''
                         
-                        # Format dates consistently
-                        if isinstance(value, (dt.datetime, dt.date)):
-                            value = format_date(value)
-                        elif value is not None:
-                            value = str(value)
-                        else:
-                            value = ''
-                            
-                        data[header] = value
+                    data[header] = value
                 
                 # Generate output filename
                 if filename_field1 or filename_field2:
@@ -322,7 +333,7 @@ def main():
                 
                 # Create output path and handle duplicates
                 base_path = os.path.join(output_directory, filename)
-                output_path = get_unique_filename(base_path, "pdf")
+                output_path = get_unique_filename(base_path, "pdf", reserved_names)
                 
                 # Replace fields and save PDF
                 replace_fields_in_pdf(pdf_template, output_path, data)
@@ -332,8 +343,9 @@ def main():
                 print(f"Processed {processed_count}/{total_files}: {os.path.basename(output_path)} in {elapsed_time:.1f} seconds")
                 
             except Exception as e:
-                print(f"Error processing row {processed_count}: {str(e)}")
-                traceback.print_exc()
+                print(f"Error processing row {processed_count}: {type(e).__name__}: {str(e)}")
+                if DEBUG:
+                    traceback.print_exc()
         
         # Print summary
         total_time = time.time() - total_start_time
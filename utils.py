@@ -8,6 +8,7 @@ This module contains shared utility functions used by multiple document processi
 - word_template_to_pdf.py
 - create_sql_csv_report.py
 - email_sql_csv_report.py
+- file_copier.py
 
 Functions include:
 - Common date formatting for consistent display of dates
@@ -15,7 +16,7 @@ Functions include:
 - Configuration file reading with standardized error handling 
 - Unique filename generation to avoid overwrites
 - Database connection handling for multiple database types
-- CSV export functionality
+- CSV export functionality, including streaming query results straight to CSV
 
 IMPORTANT: All scripts now require exact field name matches between Excel headers and PDF fields.
 No automatic normalization of field names is performed - field names are case-sensitive and 
@@ -23,12 +24,31 @@ space-sensitive.
 """
 
 import datetime as dt
+import gzip
 import os
 import re
 import csv
 import logging
+import queue
+import shutil
 import sqlite3
-import pandas as pd
+import tempfile
+import threading
+
+# Write buffer for CSV output. A large buffer means far fewer write() syscalls
+# on multi-GB exports than the default 8 KiB.
+CSV_WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Rows per chunk when pandas writes a DataFrame to CSV
+CSV_CHUNK_SIZE = 50000
+
+# Maximum number of fetched row batches waiting to be written to CSV
+CSV_QUEUE_SIZE = 32
+
+# Characters not allowed in filenames, and runs of whitespace/underscores that
+# sanitize_filename collapses to a single underscore
+INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+FILENAME_SEPARATORS = re.compile(r'[\s_]+')
 
 def format_date(value, include_time=True):
     """
@@ -68,6 +88,40 @@ def format_date(value, include_time=True):
     # For non-date values, return as string
     return str(value)
 
+def number_format_includes_time(number_format):
+    """
+    Check whether an Excel number format displays a time component.
+    
+    Args:
+        number_format (str): Excel number format string (e.g. "mm-dd-yy h:mm")
+        
+    Returns:
+        bool: True if the format shows hours or uses a time separator
+    """
+    number_format = (number_format or '').lower()
+    return 'h' in number_format or ':' in number_format
+
+def format_excel_value(value, include_time=True):
+    """
+    Format a raw Excel value, standardizing dates to "Month Day, Year".
+    
+    Use this when iterating plain values (e.g. ws.values) rather than cell objects.
+    
+    Args:
+        value: The raw cell value
+        include_time: Whether to include time component if present (default: True)
+        
+    Returns:
+        str: The formatted value
+    """
+    if value is None:
+        return ''
+    
+    if isinstance(value, (dt.datetime, dt.date)):
+        return format_date(value, include_time)
+    
+    return str(value)
+
 def format_excel_cell_date(cell):
     """
     Gets the formatted date value from an Excel cell.
@@ -86,8 +140,7 @@ def format_excel_cell_date(cell):
     # Handle date values
     if hasattr(cell, 'value') and isinstance(cell.value, (dt.datetime, dt.date)):
         # Check if format has time markers
-        number_format = cell.number_format.lower()
-        include_time = 'h' in number_format or ':' in number_format
+        include_time = number_format_includes_time(cell.number_format)
         
         return format_date(cell.value, include_time)
     
@@ -110,14 +163,13 @@ def sanitize_filename(filename, default_name="document", max_length=200):
         return default_name
         
     # Replace invalid characters with underscores
-    invalid_chars = r'[<>:"/\\|?*]'
-    sanitized = re.sub(invalid_chars, '_', str(filename))
+    sanitized = INVALID_FILENAME_CHARS.sub('_', str(filename))
     
     # Remove leading/trailing spaces and dots
     sanitized = sanitized.strip(". ")
     
     # Collapse multiple spaces and underscores to a single underscore
-    sanitized = re.sub(r'[\s_]+', '_', sanitized)
+    sanitized = FILENAME_SEPARATORS.sub('_', sanitized)
     
     # Default filename if empty after sanitization
     if not sanitized:
@@ -171,13 +223,38 @@ def read_config(config_path, required_fields=None):
     
     return config
 
-def get_unique_filename(base_path, extension="pdf"):
+def list_filenames(directory):
+    """
+    List the names of the files already in a directory, lowercased.
+    
+    Pass the result to get_unique_filename as `reserved` to find free names
+    with set lookups instead of one filesystem check per candidate. Names are
+    lowercased because Windows and macOS treat names that differ only in case
+    as the same file.
+    
+    Args:
+        directory (str): Directory to list
+        
+    Returns:
+        set: Lowercased file names (an empty set if the directory doesn't exist)
+    """
+    try:
+        return {name.lower() for name in os.listdir(directory)}
+    except FileNotFoundError:
+        return set()
+
+def get_unique_filename(base_path, extension="pdf", reserved=None):
     """
     Ensure a filename is unique by appending a counter if needed.
     
     Args:
         base_path (str): Base filepath without extension
         extension (str): File extension without the dot
+        reserved (set, optional): Lowercased names of the files already taken
+            in base_path's directory, as from list_filenames, including any
+            handed out but not yet written. When given, names are checked
+            against this set instead of the filesystem, and the returned
+            file name is added to it.
         
     Returns:
         str: Unique filepath with extension
@@ -186,13 +263,21 @@ def get_unique_filename(base_path, extension="pdf"):
     if not extension.startswith('.'):
         extension = '.' + extension
         
+    if reserved is None:
+        exists = os.path.exists
+    else:
+        def exists(path):
+            return os.path.basename(path).lower() in reserved
+        
     output_path = base_path + extension
     counter = 1
     
-    while os.path.exists(output_path):
+    while exists(output_path):
         output_path = f"{base_path}_{counter}{extension}"
         counter += 1
         
+    if reserved is not None:
+        reserved.add(os.path.basename(output_path).lower())
     return output_path 
 
 def connect_to_database(config, logger=None):
@@ -288,6 +373,9 @@ def run_query(connection, query, logger=None):
     if logger is None:
         logger = logging.getLogger(__name__)
         
+    # Imported lazily so the streaming CSV path does not require pandas
+    import pandas as pd
+    
     try:
         df = pd.read_sql_query(query, connection)
         logger.info(f"Query executed successfully. Retrieved {len(df)} rows.")
@@ -315,9 +403,122 @@ def export_to_csv(df, output_file, logger=None):
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
         
-        df.to_csv(output_file, index=False, quoting=csv.QUOTE_MINIMAL)
+        # Write through a large buffered handle rather than letting pandas
+        # open the file itself
+        with open(output_file, 'w', newline='', buffering=CSV_WRITE_BUFFER_SIZE) as f:
+            df.to_csv(f, index=False, quoting=csv.QUOTE_MINIMAL, chunksize=CSV_CHUNK_SIZE)
         logger.info(f"Data exported to CSV file: {output_file}")
         return output_file
     except Exception as e:
         logger.error(f"Error exporting to CSV: {str(e)}")
-        raise 
\ No newline at end of file
+        raise
+
+def stream_query_to_csv(connection, query, output_file, logger=None, chunk_size=10000, compress=False):
+    """
+    Run the SQL query and stream the results directly to a CSV file.
+    
+    Rows are fetched from the database cursor in chunks and written as they
+    arrive, so memory use stays proportional to chunk_size rather than the
+    size of the full result set. pandas is not used on this path.
+    
+    Batches are written to disk on a separate thread, so writing one batch
+    overlaps with waiting on the database for the next.
+    
+    With compress, the CSV is gzipped as it is written and ".gz" is added
+    to the file name. CSV data typically compresses 5-10x.
+    
+    Lines end with os.linesep, as with pandas' to_csv. The file is written
+    in a temporary directory next to output_file and only moved into place
+    once every row is written, so a failed query never leaves a truncated
+    report behind.
+    
+    Args:
+        connection: Database connection object
+        query (str): SQL query string
+        output_file (str): Path to save the CSV file
+        logger (logging.Logger, optional): Logger for logging messages
+        chunk_size (int): Number of rows to fetch from the cursor at a time
+        compress (bool): Write a gzip-compressed CSV file
+    
+    Returns:
+        str: Path to the saved CSV file
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+    
+    if compress and not output_file.endswith('.gz'):
+        output_file += '.gz'
+    
+    cursor = connection.cursor()
+    try:
+        cursor.arraysize = chunk_size
+        cursor.execute(query)
+        logger.info("Query executed successfully. Streaming results to CSV.")
+        
+        # Create directory if it doesn't exist
+        output_dir = os.path.dirname(os.path.abspath(output_file))
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Write under the final file name (which gzip records in its header)
+        # in a temporary directory on the same file system
+        temp_dir = tempfile.mkdtemp(prefix='.csv_export_', dir=output_dir)
+        temp_file = os.path.join(temp_dir, os.path.basename(output_file))
+        try:
+            row_count = 0
+            if compress:
+                output = gzip.open(temp_file, 'wt', compresslevel=6, newline='')
+            else:
+                output = open(temp_file, 'w', newline='', buffering=CSV_WRITE_BUFFER_SIZE)
+            with output as f:
+                writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL, lineterminator=os.linesep)
+                
+                # Header row comes from the cursor metadata
+                writer.writerow([column[0] for column in cursor.description or []])
+                
+                batch_queue = queue.Queue(maxsize=CSV_QUEUE_SIZE)
+                write_errors = []
+                
+                def write_batches():
+                    """Write queued row batches until the None sentinel arrives."""
+                    while True:
+                        rows = batch_queue.get()
+                        if rows is None:
+                            break
+                        if write_errors:
+                            # Keep draining so the fetch loop never blocks on a full queue
+                            continue
+                        try:
+                            writer.writerows(rows)
+                        except Exception as e:
+                            write_errors.append(e)
+                
+                writer_thread = threading.Thread(target=write_batches, daemon=True)
+                writer_thread.start()
+                
+                try:
+                    while not write_errors:
+                        rows = cursor.fetchmany(chunk_size)
+                        if not rows:
+                            break
+                        batch_queue.put(rows)
+                        row_count += len(rows)
+                finally:
+                    # Always stop the writer, even if fetching failed
+                    batch_queue.put(None)
+                    writer_thread.join()
+                
+                if write_errors:
+                    raise write_errors[0]
+            
+            os.replace(temp_file, output_file)
+        finally:
+            # Removes the partial file too if the export failed
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        
+        logger.info(f"Data exported to CSV file: {output_file} ({row_count} rows)")
+        return output_file
+    except Exception as e:
+        logger.error(f"Error streaming query results to CSV: {str(e)}")
+        raise
+    finally:
+        cursor.close()